@@ -3,31 +3,146 @@
 from __future__ import annotations
 
 import asyncio
+import json
 import logging
+import os
+import queue
 import signal
 import sys
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING, Callable, Mapping
 
-import os
-
-from jarvis.config import JarvisConfig, ensure_jarvis_home
+from jarvis.config import JARVIS_HOME, JarvisConfig, ensure_jarvis_home
 from jarvis.notifications import set_slack_bot, set_voice_client
-from jarvis.orchestrator import JarvisOrchestrator
-from jarvis.ws_server import JarvisWSServer
 from jarvis.mcp_health import health_check_all_servers, filter_healthy_servers, notify_health_failures
 from jarvis.model_router import get_model_router
 
-import os
-import traceback
-from pathlib import Path
+if TYPE_CHECKING:
+    from jarvis.ws_server import JarvisWSServer
 
 logger = logging.getLogger(__name__)
 
 
+_TRUTHY = frozenset({"true", "1", "yes"})
+
+
+def _env_flag(value: str) -> bool:
+    return value.strip().lower() in _TRUTHY
+
+
+@dataclass(frozen=True, slots=True)
+class RemoteConfig:
+    """Remote-access settings, read from the environment once per daemon."""
+
+    enabled: bool
+    port: int
+    bind: str
+    jwt_secret: str | None
+    jwt_expiry: int
+    max_devices: int
+    rest_port: int
+    tailscale: bool
+
+    @classmethod
+    def from_env(cls, environ: Mapping[str, str] = os.environ) -> RemoteConfig:
+        """Build from environment variables in a single pass."""
+        get = environ.get
+        return cls(
+            enabled=_env_flag(get("JARVIS_REMOTE_ENABLED", "false")),
+            port=int(get("JARVIS_REMOTE_PORT", "9848")),
+            bind=get("JARVIS_REMOTE_BIND", "0.0.0.0"),
+            jwt_secret=get("JARVIS_JWT_SECRET"),
+            jwt_expiry=int(get("JARVIS_JWT_EXPIRY", "86400")),
+            max_devices=int(get("MAX_DEVICES", "10")),
+            rest_port=int(get("JARVIS_REST_PORT", "9849")),
+            tailscale=_env_flag(get("TAILSCALE_ENABLED", "false")),
+        )
+
+
+# Per-service bound on graceful shutdown (seconds)
+SERVICE_STOP_TIMEOUT = 5.0
+
+# Cached `tailscale status` identity (node IP/DNS name rarely change)
+TAILSCALE_CACHE = JARVIS_HOME / "tailscale_identity.json"
+TAILSCALE_CACHE_TTL = 3600
+
+
+class _CrashLogWriter:
+    """Single background thread that appends crash records durably.
+
+    Lets code running on the event loop record a crash without blocking
+    on disk I/O; records are fsynced within milliseconds of submission.
+    close() drains what is queued before returning. If the log can't be
+    opened, records go through ``fallback`` (a synchronous append) instead.
+    """
+
+    _STOP = object()
+
+    def __init__(self, path: Path, fallback: Callable[[bytes], None]):
+        self._path = path
+        self._fallback = fallback
+        self._queue: queue.Queue = queue.Queue()
+        self._thread = threading.Thread(
+            target=self._run, name="jarvis-crash-log", daemon=True
+        )
+        self._thread.start()
+
+    def submit(self, payload: bytes) -> None:
+        """Queue a record for writing (never blocks)."""
+        if not self._thread.is_alive():
+            # Closed (or died): don't let the record sit in a dead queue
+            self._write_fallback(payload)
+            return
+        self._queue.put(payload)
+
+    def close(self, timeout: float = 5.0) -> None:
+        """Write everything queued so far, then stop the thread."""
+        if self._thread.is_alive():
+            self._queue.put(self._STOP)
+            self._thread.join(timeout)
+
+    def _write_fallback(self, payload: bytes) -> None:
+        try:
+            self._fallback(payload)
+        except OSError as e:
+            logger.error(f"Crash log write failed: {e}")
+
+    def _run(self) -> None:
+        sync = getattr(os, "fdatasync", os.fsync)  # no fdatasync on macOS
+        try:
+            self._path.parent.mkdir(parents=True, exist_ok=True)
+            f = open(self._path, "ab", buffering=0)
+        except OSError as e:
+            logger.error(f"Cannot open crash log {self._path}: {e}; writing synchronously")
+            f = None
+        try:
+            while True:
+                payload = self._queue.get()
+                if payload is self._STOP:
+                    return
+                if f is None:
+                    self._write_fallback(payload)
+                    continue
+                try:
+                    f.write(payload)
+                    sync(f.fileno())
+                except OSError as e:
+                    logger.warning(f"Crash log write failed: {e}")
+        finally:
+            if f is not None:
+                f.close()
+
+
 class CrashRecovery:
     """Daemon crash recovery: detects unclean shutdowns and recovers state."""
 
     PID_FILE = Path.home() / ".jarvis" / "daemon.pid"
     CRASH_LOG = Path.home() / ".jarvis" / "logs" / "crash.log"
+    _writer: _CrashLogWriter | None = None
+    _writer_lock = threading.Lock()
 
     @classmethod
     def write_pid(cls) -> None:
@@ -70,17 +185,58 @@ class CrashRecovery:
             # Process exists but we can't signal it
             return {"status": "running", "pid": old_pid}
 
+    @staticmethod
+    def _format_crash(error: str, exc: BaseException | None = None) -> str:
+        """Format a crash record, with exc's traceback when one is given."""
+        import traceback
+
+        record = (
+            f"\n{'='*60}\n"
+            f"Crash at: {time.strftime('%Y-%m-%d %H:%M:%S')}\n"
+            f"PID: {os.getpid()}\n"
+            f"Error: {error}\n"
+        )
+        if exc is not None:
+            record += f"Traceback:\n{''.join(traceback.format_exception(exc))}\n"
+        return record
+
     @classmethod
-    def log_crash(cls, error: str) -> None:
-        """Log crash information for post-mortem analysis."""
-        import time
+    def _append_sync(cls, payload: bytes) -> None:
         cls.CRASH_LOG.parent.mkdir(parents=True, exist_ok=True)
-        with open(cls.CRASH_LOG, "a") as f:
-            f.write(f"\n{'='*60}\n")
-            f.write(f"Crash at: {time.strftime('%Y-%m-%d %H:%M:%S')}\n")
-            f.write(f"PID: {os.getpid()}\n")
-            f.write(f"Error: {error}\n")
-            f.write(f"Traceback:\n{traceback.format_exc()}\n")
+        # Single O_DSYNC append so the record is on disk before we return,
+        # even if the process is SIGKILLed right after.
+        flags = os.O_WRONLY | os.O_CREAT | os.O_APPEND | getattr(os, "O_DSYNC", 0)
+        fd = os.open(str(cls.CRASH_LOG), flags, 0o644)
+        try:
+            os.write(fd, payload)
+        finally:
+            os.close(fd)
+
+    @classmethod
+    def log_crash(cls, error: str, exc: BaseException | None = None) -> None:
+        """Log crash information for post-mortem analysis.
+
+        Synchronous last-gasp path used by main(); use enqueue_crash()
+        from code running on the event loop.
+        """
+        cls._append_sync(cls._format_crash(error, exc).encode())
+
+    @classmethod
+    def enqueue_crash(cls, error: str, exc: BaseException | None = None) -> None:
+        """Log crash information without blocking the event loop."""
+        with cls._writer_lock:
+            if cls._writer is None:
+                cls._writer = _CrashLogWriter(cls.CRASH_LOG, cls._append_sync)
+            writer = cls._writer
+        writer.submit(cls._format_crash(error, exc).encode())
+
+    @classmethod
+    def close_crash_log(cls) -> None:
+        """Flush queued crash records to disk and stop the writer thread."""
+        with cls._writer_lock:
+            writer, cls._writer = cls._writer, None
+        if writer is not None:
+            writer.close()
 
     @classmethod
     def recover_state(cls, orchestrator) -> dict:
@@ -119,8 +275,11 @@ class JarvisDaemon:
     """Long-running daemon: WebSocket bridge + optional Slack/Voice + Idle processing."""
 
     def __init__(self, project_path: str | None = None):
+        from jarvis.orchestrator import JarvisOrchestrator
+
         ensure_jarvis_home()
         self.config = JarvisConfig.load()
+        self.remote_cfg = RemoteConfig.from_env()
         self.orchestrator = JarvisOrchestrator(project_path)
         self.events = self.orchestrator.events
         self._ws_server: JarvisWSServer | None = None
@@ -132,37 +291,41 @@ class JarvisDaemon:
         self._idle_processor = None
         self._file_watcher = None
         self._running = False
-        self._stop_event = asyncio.Event()
+        self._stopping = False
+        # Created in start() so it binds to the running loop
+        self._stop_event: asyncio.Event | None = None
+        self._task_group: asyncio.TaskGroup | None = None
+        self._background_tasks: set[asyncio.Task] = set()
 
     async def start(self) -> None:
         """Start all daemon services."""
         loop = asyncio.get_running_loop()
+        self._stop_event = asyncio.Event()
+        # Python 3.12+: run new tasks eagerly until their first suspension
+        if hasattr(asyncio, "eager_task_factory"):
+            loop.set_task_factory(asyncio.eager_task_factory)
 
         # Crash recovery
-        crash_info = CrashRecovery.check_previous_crash()
+        # Disk + SQLite work runs off the event loop
+        crash_info = await asyncio.to_thread(CrashRecovery.check_previous_crash)
         if crash_info and crash_info["status"] == "crashed":
             logger.warning(f"Detected previous crash (PID {crash_info['pid']}), recovering...")
-            recovery = CrashRecovery.recover_state(self.orchestrator)
+            recovery = await asyncio.to_thread(CrashRecovery.recover_state, self.orchestrator)
             logger.info(f"Recovery complete: {recovery}")
         elif crash_info and crash_info["status"] == "running":
             logger.error(f"Another daemon instance is running (PID {crash_info['pid']})")
             return
 
         CrashRecovery.write_pid()
+        self.events.start_flusher()
 
-        for sig in (signal.SIGTERM, signal.SIGINT):
-            loop.add_signal_handler(sig, lambda: asyncio.create_task(self.stop()))
+        # Probe MCP servers concurrently with the service startup below
+        mcp_servers = self.orchestrator.mcp_servers()
+        mcp_health_task = asyncio.create_task(health_check_all_servers(mcp_servers))
 
-        # Local WebSocket server (always)
-        self._ws_server = JarvisWSServer(
-            event_collector=self.events,
-            orchestrator=self.orchestrator,
-        )
-        await self._ws_server.start()
-
-        # Remote WSS server (if enabled)
-        if self._remote_enabled():
-            await self._start_remote_server()
+        for sig in (signal.SIGTERM, signal.SIGINT):
+            loop.add_signal_handler(sig, self._request_stop)
+        loop.set_exception_handler(self._on_loop_exception)
 
         # Slack bot (optional)
         if self.config.slack.enabled and self.config.slack.bot_token:
@@ -177,39 +340,57 @@ class JarvisDaemon:
                     orchestrator=self.orchestrator,
                 )
                 set_slack_bot(self._slack_bot)
-                await self._slack_bot.start()
-                logger.info("Slack bot started")
+                # Socket Mode runs until cancelled; launched in the task group below
             except ImportError:
                 logger.warning("slack-bolt not installed, skipping Slack integration")
             except Exception as e:
                 logger.error(f"Slack bot failed to start: {e}")
 
-        # Voice client (optional)
-        if self.config.voice.enabled and self.config.voice.api_key:
-            try:
-                from jarvis.voice import ElevenLabsVoiceClient
+        # Network services start concurrently: local WS (always),
+        # remote WSS + REST (if enabled), voice (optional)
+        from jarvis.ws_server import JarvisWSServer
 
-                self._voice_client = ElevenLabsVoiceClient(
-                    api_key=self.config.voice.api_key,
-                    agent_id=self.config.voice.agent_id,
-                    event_collector=self.events,
-                    auto_call_on_error=self.config.voice.auto_call_on_error,
-                    auto_call_on_approval=self.config.voice.auto_call_on_approval,
-                )
-                set_voice_client(self._voice_client)
-                await self._voice_client.connect()
-                logger.info("Voice client connected")
-            except ImportError:
-                logger.warning("websockets not installed, skipping voice integration")
-            except Exception as e:
-                logger.error(f"Voice client failed to connect: {e}")
+        self._ws_server = JarvisWSServer(
+            event_collector=self.events,
+            orchestrator=self.orchestrator,
+        )
+        services = {"WebSocket server": self._ws_server.start()}
+        if self._remote_enabled():
+            services["Remote server"] = self._start_remote_server()
+        if self.config.voice.enabled and self.config.voice.api_key:
+            services["Voice client"] = self._start_voice_client()
+
+        results = await asyncio.gather(*services.values(), return_exceptions=True)
+        for name, result in zip(services, results):
+            if isinstance(result, Exception):
+                logger.error(f"{name} failed to start: {result}")
+        if isinstance(results[0], Exception):
+            mcp_health_task.cancel()
+            await asyncio.gather(mcp_health_task, return_exceptions=True)
+            raise results[0]
+
+        # MCP health results (Slack bot is registered by now, so failures can be
+        # reported); agent sessions then only get the servers that passed
+        try:
+            mcp_health = await mcp_health_task
+            healthy = filter_healthy_servers(mcp_servers, mcp_health)
+            self.orchestrator.healthy_mcp_servers = healthy
+            await notify_health_failures(mcp_health)
+            logger.info(
+                f"MCP health: {len(healthy)}/{len(mcp_servers)} servers available"
+            )
+        except Exception as e:
+            logger.warning(f"MCP health check failed: {e}")
 
-        # Copy bootstrap skills on first daemon start
+        # Copy bootstrap skills on first daemon start (marker skips the walk after)
         try:
-            from jarvis.skill_generator import copy_bootstrap_skills
-            copied = copy_bootstrap_skills()
-            if copied:
-                logger.info(f"Installed {len(copied)} bootstrap skills: {', '.join(copied)}")
+            from jarvis.skill_generator import BOOTSTRAP_VERSION, copy_bootstrap_skills
+            marker = JARVIS_HOME / f".bootstrap_v{BOOTSTRAP_VERSION}"
+            if not marker.exists():
+                copied = copy_bootstrap_skills()
+                if copied:
+                    logger.info(f"Installed {len(copied)} bootstrap skills: {', '.join(copied)}")
+                marker.touch()
         except Exception as e:
             logger.warning(f"Bootstrap skills install failed: {e}")
 
@@ -223,6 +404,7 @@ class JarvisDaemon:
             logger.warning(f"Model router initialization failed: {e}")
 
         # macOS native integrations
+        iokit_idle = False
         try:
             from jarvis.macos_native import get_platform_capabilities
             caps = get_platform_capabilities()
@@ -235,16 +417,12 @@ class JarvisDaemon:
 
                 # Start IOKit-based idle detection polling
                 if caps["iokit_available"] and self._idle_processor:
-                    self._iokit_idle_task = asyncio.create_task(
-                        self._iokit_idle_loop()
-                    )
-                    logger.info("IOKit HID idle detection active")
+                    iokit_idle = True
 
                 # Load credentials from Keychain
                 from jarvis.macos_native import keychain_retrieve
                 kc_api_key = keychain_retrieve("com.jarvis.anthropic", "api_key")
                 if kc_api_key:
-                    import os
                     os.environ.setdefault("ANTHROPIC_API_KEY", kc_api_key)
                     logger.info("Loaded API key from Keychain")
         except ImportError:
@@ -255,8 +433,85 @@ class JarvisDaemon:
         self._running = True
         logger.info("Jarvis daemon started")
 
-        # Block until stop is requested
-        await self._stop_event.wait()
+        # Background loops live in a task group so that stopping (or a crash
+        # in any loop) cancels and awaits all of them together.
+        async with asyncio.TaskGroup() as tg:
+            self._task_group = tg
+            if self._slack_bot:
+                self._spawn(self._run_slack_bot())
+                logger.info("Slack bot start requested")
+            if iokit_idle:
+                self._spawn(self._iokit_idle_loop())
+                logger.info("IOKit HID idle detection active")
+
+            # Block until stop is requested
+            await self._stop_event.wait()
+            self._cancel_background_tasks()
+        self._task_group = None
+
+        await self.stop()
+
+    @staticmethod
+    def _on_loop_exception(loop: asyncio.AbstractEventLoop, context: dict) -> None:
+        """Record unhandled loop errors (e.g. a failed fire-and-forget task).
+
+        Contexts without an exception (unclosed sessions, transport
+        warnings) aren't crashes; those only go to the default handler.
+        """
+        exc = context.get("exception")
+        if exc is not None:
+            message = context.get("message") or "Unhandled exception in event loop"
+            CrashRecovery.enqueue_crash(f"{message}: {exc!r}", exc)
+        loop.default_exception_handler(context)
+
+    def _request_stop(self) -> None:
+        """Signal handler: wake start(), which then runs stop().
+
+        Idempotent: repeated SIGTERM/SIGINT while stopping are ignored.
+        """
+        if self._stop_event is None or self._stop_event.is_set():
+            return
+        logger.info("Stop requested by signal")
+        self._stop_event.set()
+
+    async def _start_voice_client(self) -> None:
+        """Connect the ElevenLabs voice client."""
+        try:
+            from jarvis.voice import ElevenLabsVoiceClient
+
+            self._voice_client = ElevenLabsVoiceClient(
+                api_key=self.config.voice.api_key,
+                agent_id=self.config.voice.agent_id,
+                event_collector=self.events,
+                auto_call_on_error=self.config.voice.auto_call_on_error,
+                auto_call_on_approval=self.config.voice.auto_call_on_approval,
+            )
+            set_voice_client(self._voice_client)
+            await self._voice_client.connect()
+            logger.info("Voice client connected")
+        except ImportError:
+            logger.warning("websockets not installed, skipping voice integration")
+        except Exception as e:
+            logger.error(f"Voice client failed to connect: {e}")
+
+    async def _run_slack_bot(self) -> None:
+        """Run the Slack Socket Mode handler until cancelled."""
+        try:
+            await self._slack_bot.start()
+        except Exception as e:
+            logger.error(f"Slack bot failed to start: {e}")
+
+    def _spawn(self, coro) -> asyncio.Task:
+        """Run a background coroutine inside the daemon's task group."""
+        task = self._task_group.create_task(coro)
+        self._background_tasks.add(task)
+        task.add_done_callback(self._background_tasks.discard)
+        return task
+
+    def _cancel_background_tasks(self) -> None:
+        """Cancel background loops; the task group awaits them on exit."""
+        for task in list(self._background_tasks):
+            task.cancel()
 
     async def _iokit_idle_loop(self) -> None:
         """Poll IOKit HID idle time and trigger idle mode transitions.
@@ -265,45 +520,67 @@ class JarvisDaemon:
         More accurate than timer-based idle detection since it
         uses real keyboard/mouse/trackpad activity.
         """
-        from jarvis.macos_native import get_idle_seconds, get_memory_pressure
+        from concurrent.futures import ThreadPoolExecutor
 
-        threshold = self.config.idle.idle_threshold_minutes * 60
+        from jarvis.macos_native import (
+            QOS_CLASS_UTILITY,
+            get_idle_seconds,
+            get_memory_pressure,
+            set_thread_qos,
+        )
 
-        while self._running:
-            try:
-                await asyncio.sleep(30)
+        threshold = self.config.idle.idle_threshold_minutes * 60
+        loop = asyncio.get_running_loop()
+        # Blocking probes run on a UTILITY-QoS thread (E-core eligible),
+        # keeping the event loop thread free for WS traffic.
+        probes = ThreadPoolExecutor(
+            max_workers=1,
+            thread_name_prefix="jarvis-idle-probe",
+            initializer=set_thread_qos,
+            initargs=(QOS_CLASS_UTILITY,),
+        )
 
-                idle_secs = get_idle_seconds()
-                if idle_secs is None:
-                    continue
+        try:
+            while self._running:
+                try:
+                    await asyncio.sleep(30)
 
-                if self._idle_processor:
-                    if idle_secs >= threshold:
-                        self._idle_processor.trigger_idle()
-                    elif idle_secs < 5:
-                        # Recent activity
-                        self._idle_processor.record_activity()
+                    idle_secs = await loop.run_in_executor(probes, get_idle_seconds)
+                    if idle_secs is None:
+                        continue
 
-                # Check memory pressure for hibernation
-                pressure = get_memory_pressure()
-                if pressure and pressure.get("should_hibernate"):
                     if self._idle_processor:
-                        self._idle_processor.trigger_hibernate()
-                    # Also unload MLX model to free memory
-                    router = get_model_router()
-                    await router.shutdown()
-                    logger.warning(
-                        f"Memory pressure CRITICAL ({pressure.get('free_mb', '?')}MB free) "
-                        "— hibernated + unloaded local models"
-                    )
-
-            except asyncio.CancelledError:
-                break
-            except Exception as e:
-                logger.debug(f"IOKit idle loop error: {e}")
+                        if idle_secs >= threshold:
+                            self._idle_processor.trigger_idle()
+                        elif idle_secs < 5:
+                            # Recent activity
+                            self._idle_processor.record_activity()
+
+                    # Check memory pressure for hibernation
+                    pressure = await loop.run_in_executor(probes, get_memory_pressure)
+                    if pressure and pressure.get("should_hibernate"):
+                        if self._idle_processor:
+                            self._idle_processor.trigger_hibernate()
+                        # Also unload MLX model to free memory
+                        router = get_model_router()
+                        await router.shutdown()
+                        logger.warning(
+                            f"Memory pressure CRITICAL ({pressure.get('free_mb', '?')}MB free) "
+                            "— hibernated + unloaded local models"
+                        )
+
+                except asyncio.CancelledError:
+                    break
+                except Exception as e:
+                    logger.debug(f"IOKit idle loop error: {e}")
+        finally:
+            probes.shutdown(wait=False)
 
     async def stop(self) -> None:
         """Gracefully stop all services."""
+        if self._stopping or not self._running:
+            return
+        self._stopping = True
         logger.info("Jarvis daemon stopping")
 
         # Shutdown model router (unload MLX)
@@ -313,77 +590,67 @@ class JarvisDaemon:
         except Exception as e:
             logger.debug(f"Model router shutdown error: {e}")
 
-        # Cancel IOKit idle loop
-        if hasattr(self, "_iokit_idle_task") and self._iokit_idle_task:
-            self._iokit_idle_task.cancel()
-            try:
-                await self._iokit_idle_task
-            except asyncio.CancelledError:
-                pass
+        # Cancel background loops (IOKit idle polling, ...)
+        self._cancel_background_tasks()
 
+        # Services shut down concurrently, each bounded so none holds up exit
+        shutdowns = {}
         if self._file_watcher:
-            try:
-                await self._file_watcher.stop()
-            except Exception as e:
-                logger.warning(f"File watcher stop error: {e}")
-
+            shutdowns["File watcher"] = self._file_watcher.stop()
         if self._idle_processor:
-            try:
-                await self._idle_processor.stop()
-            except Exception as e:
-                logger.warning(f"Idle processor stop error: {e}")
-
+            shutdowns["Idle processor"] = self._idle_processor.stop()
         if self._ws_server:
-            await self._ws_server.stop()
-
+            shutdowns["WebSocket server"] = self._ws_server.stop()
         if self._remote_server:
-            await self._remote_server.stop()
-
+            shutdowns["Remote server"] = self._remote_server.stop()
         if self._rest_runner:
-            await self._rest_runner.cleanup()
-
+            shutdowns["REST API"] = self._rest_runner.cleanup()
         if self._slack_bot:
-            try:
-                await self._slack_bot.stop()
-            except Exception as e:
-                logger.warning(f"Slack bot stop error: {e}")
-
+            shutdowns["Slack bot"] = self._slack_bot.stop()
         if self._voice_client:
-            try:
-                await self._voice_client.disconnect()
-            except Exception as e:
-                logger.warning(f"Voice client disconnect error: {e}")
+            shutdowns["Voice client"] = self._voice_client.disconnect()
 
+        results = await asyncio.gather(
+            *(asyncio.wait_for(c, timeout=SERVICE_STOP_TIMEOUT) for c in shutdowns.values()),
+            return_exceptions=True,
+        )
+        for name, result in zip(shutdowns, results):
+            if isinstance(result, asyncio.TimeoutError):
+                logger.warning(f"{name} stop timed out after {SERVICE_STOP_TIMEOUT}s")
+            elif isinstance(result, Exception):
+                logger.warning(f"{name} stop error: {result}")
+
+        await self.events.stop_flusher()
+        await asyncio.to_thread(CrashRecovery.close_crash_log)
         self._running = False
         CrashRecovery.clear_pid()
-        self._stop_event.set()
+        if self._stop_event is not None:
+            self._stop_event.set()
 
     def _remote_enabled(self) -> bool:
         """Check if remote server is enabled."""
-        return os.getenv("JARVIS_REMOTE_ENABLED", "false").lower() in ("true", "1", "yes")
+        return self.remote_cfg.enabled
 
     async def _start_remote_server(self) -> None:
         """Start remote WSS server and REST API."""
         try:
             from jarvis.remote_server import JarvisRemoteServer, RESTAPIHandler
             from jarvis.auth import Authenticator
-            from aiohttp import web
 
             # Initialize authenticator
-            jwt_secret = os.getenv("JARVIS_JWT_SECRET")
+            jwt_secret = self.remote_cfg.jwt_secret
             if not jwt_secret:
                 logger.warning("JARVIS_JWT_SECRET not set, using default (UNSAFE)")
                 jwt_secret = "change-me-in-production"
 
             authenticator = Authenticator(
                 secret=jwt_secret,
-                expiry_seconds=int(os.getenv("JARVIS_JWT_EXPIRY", "86400")),
-                max_devices=int(os.getenv("MAX_DEVICES", "10")),
+                expiry_seconds=self.remote_cfg.jwt_expiry,
+                max_devices=self.remote_cfg.max_devices,
             )
 
-            # Start remote WSS server
-            remote_port = int(os.getenv("JARVIS_REMOTE_PORT", "9848"))
-            remote_bind = os.getenv("JARVIS_REMOTE_BIND", "0.0.0.0")
+            remote_port = self.remote_cfg.port
+            remote_bind = self.remote_cfg.bind
 
             self._remote_server = JarvisRemoteServer(
                 event_collector=self.events,
@@ -392,32 +659,84 @@ class JarvisDaemon:
                 port=remote_port,
                 bind=remote_bind,
             )
-            await self._remote_server.start()
-            logger.info(f"Remote WSS server started on {remote_bind}:{remote_port}")
-
-            # Start REST API
             rest_handler = RESTAPIHandler(authenticator, self._remote_server)
-            self._rest_app = await rest_handler.create_app()
-
-            if self._rest_app:
-                rest_port = int(os.getenv("JARVIS_REST_PORT", "9849"))
-                self._rest_runner = web.AppRunner(self._rest_app)
-                await self._rest_runner.setup()
-                site = web.TCPSite(self._rest_runner, "0.0.0.0", rest_port)
-                await site.start()
-                logger.info(f"REST API started on port {rest_port}")
-
-                # Start Tailscale funnel if enabled
-                if os.getenv("TAILSCALE_ENABLED", "false").lower() == "true":
-                    await self._start_tailscale_funnel(remote_port)
-
-        except ImportError as e:
-            logger.warning(f"Remote server dependencies missing: {e}")
-        except Exception as e:
-            logger.error(f"Remote server failed to start: {e}")
+
+            # Independent sub-startups; a failure cancels the siblings still
+            # starting instead of leaving them orphaned
+            async with asyncio.TaskGroup() as tg:
+                tg.create_task(self._start_remote_ws(), name="remote_ws")
+                tg.create_task(self._start_rest_api(rest_handler), name="rest_api")
+                if self.remote_cfg.tailscale:
+                    tg.create_task(self._start_tailscale_funnel(remote_port), name="tailscale")
+
+        # except* also matches failures raised inside the task group, which
+        # arrive wrapped in an ExceptionGroup (e.g. aiohttp missing)
+        except* ImportError as eg:
+            for e in eg.exceptions:
+                logger.warning(f"Remote server dependencies missing: {e}")
+        except* Exception as eg:
+            for e in eg.exceptions:
+                logger.error(f"Remote server failed to start: {e}")
+
+    async def _start_remote_ws(self) -> None:
+        """Start the remote WSS server."""
+        await self._remote_server.start()
+        logger.info(f"Remote WSS server started on {self.remote_cfg.bind}:{self.remote_cfg.port}")
+
+    async def _start_rest_api(self, rest_handler) -> None:
+        """Start the REST API alongside the remote WSS server."""
+        self._rest_app = await rest_handler.create_app()
+        if not self._rest_app:
+            return  # aiohttp not installed
+
+        from aiohttp import web
+
+        rest_port = self.remote_cfg.rest_port
+        self._rest_runner = web.AppRunner(
+            self._rest_app, keepalive_timeout=75, tcp_keepalive=True
+        )
+        await self._rest_runner.setup()
+        # SO_REUSEPORT + a deep backlog absorb reconnect bursts from devices
+        site = web.TCPSite(
+            self._rest_runner, "0.0.0.0", rest_port, reuse_port=True, backlog=2048
+        )
+        await site.start()
+        logger.info(f"REST API started on port {rest_port}")
+
+    async def _tailscale_identity(self) -> tuple[str | None, str | None]:
+        """Return this node's Tailscale IPv4 and DNS name.
+
+        Cached for TAILSCALE_CACHE_TTL since the node identity rarely
+        changes; only a cache miss spawns `tailscale status --json`.
+        """
+        try:
+            if time.time() - TAILSCALE_CACHE.stat().st_mtime < TAILSCALE_CACHE_TTL:
+                cached = json.loads(TAILSCALE_CACHE.read_text())
+                return cached.get("ip"), cached.get("dns_name")
+        except (OSError, ValueError):
+            pass
+
+        proc = await asyncio.create_subprocess_exec(
+            "tailscale", "status", "--json",
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+        )
+        stdout, _ = await proc.communicate()
+        if proc.returncode != 0:
+            return None, None
+
+        self_node = json.loads(stdout).get("Self") or {}
+        ts_ip = next((ip for ip in self_node.get("TailscaleIPs", []) if "." in ip), None)
+        dns_name = (self_node.get("DNSName") or "").rstrip(".") or None
+        try:
+            TAILSCALE_CACHE.write_text(json.dumps({"ip": ts_ip, "dns_name": dns_name}))
+        except OSError as e:
+            logger.debug(f"Could not cache Tailscale identity: {e}")
+        return ts_ip, dns_name
 
     async def _start_tailscale_funnel(self, port: int) -> None:
         """Start Tailscale funnel for remote access."""
+        proc = None
         try:
             import asyncio.subprocess
 
@@ -427,8 +746,12 @@ class JarvisDaemon:
                 stderr=asyncio.subprocess.PIPE,
             )
 
-            # Wait a bit to check if it started successfully
-            await asyncio.sleep(2)
+            # An early exit means the funnel failed; still running after the
+            # grace period means it is serving
+            try:
+                await asyncio.wait_for(proc.wait(), timeout=2.0)
+            except asyncio.TimeoutError:
+                pass
 
             if proc.returncode is not None:
                 stderr = await proc.stderr.read()
@@ -436,37 +759,56 @@ class JarvisDaemon:
             else:
                 logger.info(f"Tailscale funnel started for port {port}")
 
-                # Get Tailscale IP
-                ip_proc = await asyncio.create_subprocess_exec(
-                    "tailscale", "ip", "-4",
-                    stdout=asyncio.subprocess.PIPE,
-                    stderr=asyncio.subprocess.PIPE,
-                )
-                stdout, _ = await ip_proc.communicate()
-                if ip_proc.returncode == 0:
-                    ts_ip = stdout.decode().strip()
+                ts_ip, dns_name = await self._tailscale_identity()
+                if ts_ip:
                     logger.info(f"Tailscale IP: {ts_ip}")
-
+                if dns_name:
+                    logger.info(f"Tailscale DNS name: {dns_name}")
+
+        except asyncio.CancelledError:
+            # A sibling startup failed; don't leave the funnel serving
+            if proc is not None and proc.returncode is None:
+                proc.kill()
+                await proc.wait()
+            raise
         except FileNotFoundError:
             logger.warning("Tailscale not installed")
         except Exception as e:
             logger.error(f"Tailscale funnel error: {e}")
 
 
+def _event_loop_factory():
+    """Return uvloop's loop factory if installed, else None (stdlib loop)."""
+    if sys.platform == "win32":
+        return None
+    try:
+        import uvloop
+    except ImportError:
+        return None
+    return uvloop.new_event_loop
+
+
 def main():
     """Entry point for python -m jarvis.daemon."""
     logging.basicConfig(
         level=logging.INFO,
         format="%(asctime)s [%(name)s] %(levelname)s: %(message)s",
     )
+    # Keep the event loop thread (WS/REST/Slack traffic) on performance cores
+    from jarvis.macos_native import QOS_CLASS_USER_INITIATED, set_thread_qos
+    set_thread_qos(QOS_CLASS_USER_INITIATED)
     project_path = sys.argv[1] if len(sys.argv) > 1 else None
     daemon = JarvisDaemon(project_path=project_path)
     try:
-        asyncio.run(daemon.start())
+        with asyncio.Runner(loop_factory=_event_loop_factory()) as runner:
+            runner.run(daemon.start())
     except Exception as e:
-        CrashRecovery.log_crash(str(e))
+        # Queued in-loop records first, so the log stays in order
+        CrashRecovery.close_crash_log()
+        CrashRecovery.log_crash(str(e), e)
         raise
     finally:
+        CrashRecovery.close_crash_log()
         CrashRecovery.clear_pid()
 
 
@@ -9,15 +9,17 @@ Implements trust thresholds for recommendation confidence:
 
 from __future__ import annotations
 
+import asyncio
 import json
 import logging
-import time
-import uuid
-from dataclasses import dataclass, field
+import secrets
+from dataclasses import dataclass
 from enum import Enum
 
 logger = logging.getLogger(__name__)
 
+_EMPTY_CTX = "{}"
+
 
 class TraceCategory(Enum):
     """Categories for decision traces."""
@@ -31,7 +33,14 @@ class TraceCategory(Enum):
     DEPENDENCY_MGMT = "dependency_mgmt"
 
 
-@dataclass
+def _category_value(category: TraceCategory | str | None) -> str | None:
+    """Normalize a category enum or raw string to its stored value."""
+    if category is None or isinstance(category, str):
+        return category
+    return category.value
+
+
+@dataclass(frozen=True, slots=True)
 class TraceResult:
     """A decision trace record."""
 
@@ -64,26 +73,29 @@ class DecisionTracer:
     async def query_precedents(
         self,
         query: str,
-        category: TraceCategory | None = None,
+        category: TraceCategory | str | None = None,
         limit: int = 5,
     ) -> list[TraceResult]:
         """Query for similar past decisions.
 
         Tries MCP context_query_traces first, falls back to local.
         """
-        results = []
+        cat_value = _category_value(category)
+        # Keyed by trace_id so overlapping responses don't yield duplicates
+        seen: dict[str, TraceResult] = {}
 
         # Try MCP first
         if self._mcp:
             try:
                 mcp_args = {"query": query, "limit": limit}
-                if category:
-                    mcp_args["category"] = category.value
+                if cat_value:
+                    mcp_args["category"] = cat_value
                 response = await self._mcp.call_tool("context_query_traces", mcp_args)
                 if response and isinstance(response, list):
                     for item in response:
-                        results.append(TraceResult(
-                            trace_id=item.get("id", ""),
+                        trace_id = item.get("id", "")
+                        seen.setdefault(trace_id, TraceResult(
+                            trace_id=trace_id,
                             category=item.get("category", ""),
                             description=item.get("description", ""),
                             decision=item.get("decision", ""),
@@ -91,18 +103,19 @@ class DecisionTracer:
                             confidence=item.get("confidence", 0.0),
                             similarity=item.get("similarity", 0.0),
                         ))
-                    return results
+                    return list(seen.values())[:limit]
             except Exception as e:
-                logger.debug(f"MCP query_traces failed, using local: {e}")
+                logger.debug("MCP query_traces failed, using local: %s", e)
 
         # Fallback to local
         if self._memory:
-            cat_value = category.value if category else None
             local_traces = self._memory.query_local_traces(
                 project_path=None, category=cat_value, limit=limit
             )
             for t in local_traces:
-                results.append(TraceResult(
+                if len(seen) >= limit:
+                    break
+                seen.setdefault(t["id"], TraceResult(
                     trace_id=t["id"],
                     category=t["category"],
                     description=t["description"],
@@ -112,11 +125,11 @@ class DecisionTracer:
                     similarity=0.0,
                 ))
 
-        return results
+        return list(seen.values())
 
     async def store_trace(
         self,
-        category: TraceCategory,
+        category: TraceCategory | str,
         description: str,
         decision: str,
         context: dict | None = None,
@@ -128,27 +141,28 @@ class DecisionTracer:
         Writes to MCP (if available) and always to local.
         Returns the trace ID.
         """
-        trace_id = f"trace-{uuid.uuid4().hex[:8]}"
+        trace_id = f"trace-{secrets.token_hex(4)}"
+        cat_value = _category_value(category)
 
         # Try MCP
         if self._mcp:
             try:
                 await self._mcp.call_tool("context_store_trace", {
                     "id": trace_id,
-                    "category": category.value,
+                    "category": cat_value,
                     "description": description,
                     "decision": decision,
-                    "context": json.dumps(context or {}),
+                    "context": json.dumps(context, separators=(",", ":")) if context else _EMPTY_CTX,
                     "outcome": outcome,
                 })
             except Exception as e:
-                logger.debug(f"MCP store_trace failed: {e}")
+                logger.debug("MCP store_trace failed: %s", e)
 
         # Always write local
         if self._memory:
             self._memory.store_local_trace(
                 trace_id=trace_id,
-                category=category.value,
+                category=cat_value,
                 description=description,
                 decision=decision,
                 context=context,
@@ -171,19 +185,31 @@ class DecisionTracer:
             outcome: New outcome (e.g., "success", "failure", "partial")
             notes: Optional notes about the outcome
         """
-        # Try MCP
+        # MCP round-trip and local SQLite write run concurrently
+        writes = []
         if self._mcp:
-            try:
-                mcp_args = {"id": trace_id, "outcome": outcome}
-                if notes:
-                    mcp_args["notes"] = notes
-                await self._mcp.call_tool("context_update_outcome", mcp_args)
-            except Exception as e:
-                logger.debug(f"MCP update_outcome failed: {e}")
-
+            writes.append(self._mcp_update_outcome(trace_id, outcome, notes))
         # Always update local
         if self._memory:
-            self._memory.update_local_trace_outcome(trace_id, outcome, notes)
+            writes.append(asyncio.to_thread(
+                self._memory.update_local_trace_outcome, trace_id, outcome, notes
+            ))
+
+        results = await asyncio.gather(*writes, return_exceptions=True)
+        for result in results:
+            if isinstance(result, Exception):
+                raise result
+
+    async def _mcp_update_outcome(
+        self, trace_id: str, outcome: str, notes: str | None
+    ) -> None:
+        try:
+            mcp_args = {"id": trace_id, "outcome": outcome}
+            if notes:
+                mcp_args["notes"] = notes
+            await self._mcp.call_tool("context_update_outcome", mcp_args)
+        except Exception as e:
+            logger.debug("MCP update_outcome failed: %s", e)
 
     @staticmethod
     def get_recommendation(traces: list[TraceResult]) -> dict:
@@ -204,16 +230,19 @@ class DecisionTracer:
             }
 
         # Find the best match (highest confidence with successful outcome)
-        successful = [t for t in traces if t.outcome == "success"]
-        if not successful:
+        best = None
+        best_conf = 0.0
+        for t in traces:
+            if t.outcome == "success" and (best is None or t.confidence > best_conf):
+                best = t
+                best_conf = t.confidence
+        if best is None:
             return {
                 "action": "new_decision",
-                "trace": traces[0] if traces else None,
+                "trace": traces[0],
                 "reason": "No successful precedents found",
             }
 
-        best = max(successful, key=lambda t: t.confidence)
-
         if best.confidence > 0.75:
             return {
                 "action": "use",
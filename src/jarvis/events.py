@@ -2,8 +2,13 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
+import sqlite3
+import threading
 import time
+import weakref
+from contextvars import ContextVar
 from typing import Any, Callable
 
 logger = logging.getLogger(__name__)
@@ -20,22 +25,57 @@ EVENT_TRUST_CHANGE = "trust_change"
 EVENT_TASK_START = "task_start"
 EVENT_TASK_COMPLETE = "task_complete"
 
+# Batched persistence: flush after this many events or this many seconds
+EVENT_FLUSH_BATCH = 100
+EVENT_FLUSH_INTERVAL = 0.05
+# Event IDs reserved from the DB per round-trip while batching
+EVENT_ID_BLOCK = 256
+
+
+def _listener_ref(callback: Callable) -> Callable[[], Callable | None]:
+    """Reference a listener: weakly for bound methods, strongly otherwise.
+
+    Bound methods (the WS/remote/voice/Slack handlers) are held through
+    WeakMethod so a server that is dropped without calling remove_listener
+    doesn't stay alive through the event bus. Plain functions and lambdas
+    would be collected immediately, so they are kept strongly.
+    """
+    if hasattr(callback, "__self__") and hasattr(callback, "__func__"):
+        return weakref.WeakMethod(callback)
+    return lambda: callback
+
 
 class EventCollector:
     """Central event bus: writes to SQLite and notifies listeners."""
 
     def __init__(self, memory, session_id: str | None = None):
         self._memory = memory
-        self._session_id = session_id
-        self._listeners: list[Callable] = []
+        # Task-local: a session set inside one asyncio task doesn't leak into
+        # concurrently running tasks (each task copies the context at creation)
+        self._session_ctx: ContextVar[str | None] = ContextVar(
+            "jarvis_session_id", default=session_id
+        )
+        self._listeners: list[Callable[[], Callable | None]] = []
+        # Immutable snapshot iterated by emit(); rebuilt on add/remove
+        self._listeners_snapshot: tuple[Callable[[], Callable | None], ...] = ()
+        self._listeners_lock = threading.Lock()
+        # Set while a flusher is running; emit() then queues instead of writing
+        self._queue: asyncio.Queue | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._flusher: asyncio.Task | None = None
+        # Block of IDs reserved in the DB for batched events, so listeners get
+        # the ID the row is later stored under; [_next_id, _id_limit)
+        self._next_id = 0
+        self._id_limit = 0
+        self._ids_lock = threading.Lock()
 
     @property
     def session_id(self) -> str | None:
-        return self._session_id
+        return self._session_ctx.get()
 
     @session_id.setter
     def session_id(self, value: str):
-        self._session_id = value
+        self._session_ctx.set(value)
 
     def emit(
         self,
@@ -46,46 +86,187 @@ class EventCollector:
         feature_id: str | None = None,
         cost_usd: float = 0.0,
         metadata: dict | None = None,
-    ) -> int:
-        """Emit an event: persist to SQLite and notify all listeners."""
-        event_id = self._memory.record_event(
-            event_type=event_type,
-            summary=summary,
-            session_id=self._session_id,
-            task_id=task_id,
-            feature_id=feature_id,
-            cost_usd=cost_usd,
-            metadata=metadata,
-        )
+    ) -> int | None:
+        """Emit an event: persist to SQLite and notify all listeners.
 
-        event_data = {
-            "id": event_id,
-            "timestamp": time.time(),
-            "event_type": event_type,
-            "summary": summary,
-            "session_id": self._session_id,
-            "task_id": task_id,
-            "feature_id": feature_id,
-            "cost_usd": cost_usd,
-            "metadata": metadata,
-        }
-
-        for listener in self._listeners:
-            try:
-                listener(event_data)
-            except Exception as e:
-                logger.warning(f"Event listener error: {e}")
+        Returns the event ID. While the flusher runs the ID is assigned
+        up front and the row is written with it in a later batch.
+        """
+        session_id = self._session_ctx.get()
+        timestamp = time.time()
+        if self._queue is not None:
+            event_id = self._reserve_id()
+            row = (event_id, timestamp, event_type, summary, session_id, task_id,
+                   feature_id, cost_usd, metadata)
+            self._enqueue(row)
+        else:
+            event_id = self._memory.record_event(
+                event_type=event_type,
+                summary=summary,
+                session_id=session_id,
+                task_id=task_id,
+                feature_id=feature_id,
+                cost_usd=cost_usd,
+                metadata=metadata,
+            )
+
+        listeners = self._listeners_snapshot
+        if listeners:
+            event_data = {
+                "id": event_id,
+                "timestamp": timestamp,
+                "event_type": event_type,
+                "summary": summary,
+                "session_id": session_id,
+                "task_id": task_id,
+                "feature_id": feature_id,
+                "cost_usd": cost_usd,
+                "metadata": metadata,
+            }
 
+            dead = False
+            for ref in listeners:
+                listener = ref()
+                if listener is None:
+                    dead = True
+                    continue
+                try:
+                    listener(event_data)
+                except Exception as e:
+                    logger.warning(f"Event listener error: {e}")
+            if dead:
+                self._prune_listeners()
         return event_id
 
     def add_listener(self, callback: Callable[[dict], Any]) -> None:
         """Register a listener for all events."""
-        if callback not in self._listeners:
-            self._listeners.append(callback)
+        with self._listeners_lock:
+            if any(ref() == callback for ref in self._listeners):
+                return
+            self._listeners.append(_listener_ref(callback))
+            self._listeners_snapshot = tuple(self._listeners)
 
     def remove_listener(self, callback: Callable) -> None:
         """Remove a registered listener."""
+        with self._listeners_lock:
+            remaining = [ref for ref in self._listeners if ref() != callback]
+            if len(remaining) == len(self._listeners):
+                return
+            self._listeners = remaining
+            self._listeners_snapshot = tuple(remaining)
+
+    def _prune_listeners(self) -> None:
+        """Drop references to listeners that have been garbage-collected."""
+        with self._listeners_lock:
+            self._listeners = [ref for ref in self._listeners if ref() is not None]
+            self._listeners_snapshot = tuple(self._listeners)
+
+    # --- Batched persistence ---
+
+    def start_flusher(self) -> None:
+        """Batch event writes through a background task on the running loop.
+
+        Without a flusher (e.g. one-shot CLI runs), emit() writes each
+        event synchronously.
+        """
+        if self._flusher is not None:
+            return
+        self._loop = asyncio.get_running_loop()
+        self._queue = asyncio.Queue()
+        self._flusher = asyncio.create_task(self._flush_loop())
+
+    async def stop_flusher(self) -> None:
+        """Stop the flusher and persist any queued events."""
+        if self._flusher is None:
+            return
+        flusher, queue = self._flusher, self._queue
+        # From here on emit() writes synchronously
+        self._flusher = None
+        self._queue = None
+        self._loop = None
+        flusher.cancel()
         try:
-            self._listeners.remove(callback)
-        except ValueError:
+            await flusher
+        except asyncio.CancelledError:
             pass
+        # Let rows handed over by other threads via call_soon_threadsafe land
+        await asyncio.sleep(0)
+        rows = []
+        while not queue.empty():
+            rows.append(queue.get_nowait())
+        self._write_batch(rows)
+
+    def _enqueue(self, row: tuple) -> None:
+        queue, loop = self._queue, self._loop
+        if queue is None or loop is None:
+            # Flusher stopped since emit() checked; write directly
+            self._write_batch([row])
+            return
+        try:
+            on_loop = asyncio.get_running_loop() is loop
+        except RuntimeError:
+            on_loop = False
+        if on_loop:
+            queue.put_nowait(row)
+            return
+        try:
+            loop.call_soon_threadsafe(queue.put_nowait, row)
+        except RuntimeError:
+            # Loop already closed
+            self._write_batch([row])
+
+    async def _flush_loop(self) -> None:
+        loop = asyncio.get_running_loop()
+        queue = self._queue
+        while True:
+            batch = [await queue.get()]
+            try:
+                deadline = loop.time() + EVENT_FLUSH_INTERVAL
+                while len(batch) < EVENT_FLUSH_BATCH:
+                    remaining = deadline - loop.time()
+                    if remaining <= 0:
+                        break
+                    try:
+                        batch.append(await asyncio.wait_for(queue.get(), remaining))
+                    except asyncio.TimeoutError:
+                        break
+            finally:
+                self._write_batch(batch)
+
+    def _reserve_id(self) -> int:
+        """Next batched-event ID, reserving a fresh block from the DB as needed.
+
+        Reserved blocks are safe from every other writer on the database
+        (other processes included), which keep using AUTOINCREMENT.
+        """
+        with self._ids_lock:
+            if self._next_id >= self._id_limit:
+                first = self._memory.reserve_event_ids(EVENT_ID_BLOCK)
+                self._next_id, self._id_limit = first, first + EVENT_ID_BLOCK
+            event_id = self._next_id
+            self._next_id += 1
+            return event_id
+
+    def _write_batch(self, rows: list[tuple]) -> None:
+        try:
+            self._memory.record_events(rows)
+        except sqlite3.IntegrityError as e:
+            # Shouldn't happen with reserved IDs, but never drop the batch
+            # over an ID clash: store each row under a fresh ID instead
+            logger.warning(f"Event ID conflict ({e}); writing {len(rows)} events individually")
+            for (_, _, event_type, summary, session_id, task_id,
+                 feature_id, cost_usd, metadata) in rows:
+                try:
+                    self._memory.record_event(
+                        event_type=event_type,
+                        summary=summary,
+                        session_id=session_id,
+                        task_id=task_id,
+                        feature_id=feature_id,
+                        cost_usd=cost_usd,
+                        metadata=metadata,
+                    )
+                except Exception as e:
+                    logger.error(f"Event write failed: {e}")
+        except Exception as e:
+            logger.error(f"Event batch write failed ({len(rows)} events): {e}")
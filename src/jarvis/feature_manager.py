@@ -2,10 +2,19 @@
 
 from __future__ import annotations
 
+import heapq
 import json
 import logging
+import os
+from collections import Counter
 from dataclasses import dataclass, field
 from pathlib import Path
+from typing import ValuesView
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 logger = logging.getLogger(__name__)
 
@@ -18,7 +27,7 @@ VALID_STATUS_TRANSITIONS: dict[str, set[str]] = {
 }
 
 
-@dataclass
+@dataclass(slots=True)
 class Feature:
     """A single feature in the build plan."""
 
@@ -71,31 +80,62 @@ class FeatureManager:
         self._project_path = Path(project_path)
         self._features_path = self._project_path / ".jarvis" / "feature-list.json"
         self._features: dict[str, Feature] = {}
+        # Ready queue (Kahn's algorithm): untested-dependency counts, reverse
+        # edges, and a heap of (priority, insertion order, id) for features
+        # whose dependencies are all tested. Entries go stale when a feature
+        # leaves "pending" and are skipped lazily.
+        self._unmet: dict[str, int] = {}
+        self._dependents: dict[str, list[str]] = {}
+        self._ready: list[tuple[int, int, str]] = []
+        self._queued: set[str] = set()
+        self._order: dict[str, int] = {}
+        # Errors from the last validate_features() run; cleared by load() and
+        # create_from_plan(), the only operations that change the graph
+        self._validation_cache: list[str] | None = None
 
     @property
-    def features(self) -> list[Feature]:
-        return list(self._features.values())
+    def features(self) -> ValuesView[Feature]:
+        """Live view of all features; use list(mgr.features) for a snapshot."""
+        return self._features.values()
 
     def load(self) -> FeatureManager:
         """Load features from disk. Returns self for chaining."""
         if not self._features_path.exists():
             return self
         try:
-            data = json.loads(self._features_path.read_text())
+            raw = self._features_path.read_bytes()
+            data = orjson.loads(raw) if orjson else json.loads(raw)
             self._features = {
                 f["id"]: Feature.from_dict(f) for f in data.get("features", [])
             }
+            self._rebuild_ready_queue()
+            self._validation_cache = None
         except (json.JSONDecodeError, KeyError) as e:
             logger.warning(f"Failed to load features: {e}")
         return self
 
-    def save(self) -> None:
-        """Persist features to disk."""
+    def save(self, pretty: bool = False) -> None:
+        """Persist features to disk.
+
+        The file is machine-owned, so it is written compactly; pass
+        pretty=True for an indented dump when debugging.
+        """
         self._features_path.parent.mkdir(parents=True, exist_ok=True)
-        data = {
-            "features": [f.to_dict() for f in self._features.values()],
-        }
-        self._features_path.write_text(json.dumps(data, indent=2))
+        if orjson:
+            # orjson serializes the slotted dataclasses directly, in field
+            # order, without building a to_dict() copy per feature
+            data = {"features": list(self._features.values())}
+            payload = orjson.dumps(data, option=orjson.OPT_INDENT_2 if pretty else 0)
+        else:
+            data = {"features": [f.to_dict() for f in self._features.values()]}
+            if pretty:
+                payload = json.dumps(data, indent=2).encode()
+            else:
+                payload = json.dumps(data, separators=(",", ":")).encode()
+        # Write-then-rename so a crash mid-write never truncates the plan
+        tmp_path = self._features_path.with_suffix(".json.tmp")
+        tmp_path.write_bytes(payload)
+        os.replace(tmp_path, self._features_path)
 
     def get_feature(self, feature_id: str) -> Feature | None:
         """Look up a feature by ID."""
@@ -108,23 +148,45 @@ class FeatureManager:
         Then sorts by priority (lowest number = highest priority).
         Returns the first pending feature, or None.
         """
-        ready: list[Feature] = []
-        for feat in self._features.values():
-            if feat.status != "pending":
-                continue
-            # All deps must be tested
-            deps_met = all(
-                self._features.get(dep_id) and self._features[dep_id].status == "tested"
-                for dep_id in feat.dependencies
-            )
-            if deps_met:
-                ready.append(feat)
-
-        if not ready:
-            return None
-
-        ready.sort(key=lambda f: f.priority)
-        return ready[0]
+        ready = self._ready
+        while ready:
+            fid = ready[0][2]
+            feat = self._features[fid]
+            if feat.status == "pending":
+                return feat
+            heapq.heappop(ready)
+            self._queued.discard(fid)
+        return None
+
+    def _push_ready(self, feat: Feature) -> None:
+        if feat.id not in self._queued:
+            self._queued.add(feat.id)
+            heapq.heappush(self._ready, (feat.priority, self._order[feat.id], feat.id))
+
+    def _rebuild_ready_queue(self) -> None:
+        """Recompute dependency counts and the ready heap from scratch."""
+        features = self._features
+        self._order = {fid: i for i, fid in enumerate(features)}
+        self._unmet = {}
+        self._dependents = {}
+        for feat in features.values():
+            unmet = 0
+            for dep_id in feat.dependencies:
+                self._dependents.setdefault(dep_id, []).append(feat.id)
+                dep = features.get(dep_id)
+                # Unknown dependencies can never be satisfied
+                if dep is None or dep.status != "tested":
+                    unmet += 1
+            self._unmet[feat.id] = unmet
+
+        self._queued = {
+            fid for fid, feat in features.items()
+            if feat.status == "pending" and not self._unmet[fid]
+        }
+        self._ready = [
+            (features[fid].priority, self._order[fid], fid) for fid in self._queued
+        ]
+        heapq.heapify(self._ready)
 
     def mark_status(self, feature_id: str, status: str) -> None:
         """Update feature status with transition validation.
@@ -147,23 +209,27 @@ class FeatureManager:
             )
 
         feat.status = status
+        if status == "tested":
+            for child_id in self._dependents.get(feature_id, ()):
+                self._unmet[child_id] -= 1
+                child = self._features[child_id]
+                if not self._unmet[child_id] and child.status == "pending":
+                    self._push_ready(child)
+        elif status == "pending" and not self._unmet[feature_id]:
+            self._push_ready(feat)
         logger.info(f"Feature {feature_id}: {feat.status} -> {status}")
 
     def progress(self) -> dict:
         """Return progress counts by status."""
-        counts = {
-            "total": 0,
-            "pending": 0,
-            "in_progress": 0,
-            "implemented": 0,
-            "tested": 0,
-            "blocked": 0,
+        by_status = Counter(feat.status for feat in self._features.values())
+        return {
+            "total": len(self._features),
+            "pending": by_status["pending"],
+            "in_progress": by_status["in_progress"],
+            "implemented": by_status["implemented"],
+            "tested": by_status["tested"],
+            "blocked": by_status["blocked"],
         }
-        for feat in self._features.values():
-            counts["total"] += 1
-            if feat.status in counts:
-                counts[feat.status] += 1
-        return counts
 
     def create_from_plan(self, plan_json: str | dict) -> None:
         """Parse a plan and create Feature objects.
@@ -175,18 +241,22 @@ class FeatureManager:
             plan_json = json.loads(plan_json)
 
         subtasks = plan_json.get("subtasks", [])
-        for i, task in enumerate(subtasks):
-            feature_id = task.get("id", f"feat-{i + 1}")
-            feat = Feature(
-                id=feature_id,
+        new_features = [
+            Feature(
+                id=task.get("id", f"feat-{i + 1}"),
                 description=task.get("description", ""),
                 priority=task.get("priority", i + 1),
                 phase=task.get("phase", "core"),
                 dependencies=task.get("dependencies", []),
                 acceptance_criteria=task.get("acceptance_criteria", []),
             )
-            self._features[feature_id] = feat
+            for i, task in enumerate(subtasks)
+        ]
+        self._features.update({feat.id: feat for feat in new_features})
 
+        # Derived state is invalidated once for the whole batch
+        self._rebuild_ready_queue()
+        self._validation_cache = None
         logger.info(f"Created {len(subtasks)} features from plan")
 
     def validate_features(self) -> list[str]:
@@ -196,43 +266,83 @@ class FeatureManager:
         - All IDs unique (enforced by dict)
         - All dependency IDs exist
         - No circular dependencies
-        """
-        errors: list[str] = []
-        all_ids = set(self._features.keys())
 
-        # Check dependency references
-        for feat in self._features.values():
-            for dep_id in feat.dependencies:
-                if dep_id not in all_ids:
-                    errors.append(
-                        f"Feature '{feat.id}' depends on unknown '{dep_id}'"
-                    )
-
-        # Check circular dependencies via DFS
-        visited: set[str] = set()
-        in_stack: set[str] = set()
-
-        def _dfs(fid: str) -> bool:
-            """Returns True if cycle detected."""
-            if fid in in_stack:
-                return True
-            if fid in visited:
-                return False
-            visited.add(fid)
-            in_stack.add(fid)
-            feat = self._features.get(fid)
-            if feat:
-                for dep_id in feat.dependencies:
-                    if dep_id in all_ids and _dfs(dep_id):
-                        errors.append(
-                            f"Circular dependency detected involving '{fid}'"
-                        )
-                        return True
-            in_stack.discard(fid)
-            return False
-
-        for fid in all_ids:
-            if fid not in visited:
-                _dfs(fid)
-
-        return errors
+        The result is cached until load() or create_from_plan() changes the
+        graph; status updates don't invalidate it. Like the ready queue, this
+        assumes Feature.dependencies isn't edited in place.
+        """
+        if self._validation_cache is not None:
+            return list(self._validation_cache)
+
+        # Single traversal: iterative Tarjan SCC, which also collects
+        # references to unknown dependencies as it walks each edge
+        missing: list[tuple[str, str]] = []
+        sccs = self._strongly_connected(missing)
+        missing.sort(key=lambda edge: self._order[edge[0]])  # plan order
+
+        errors = [
+            f"Feature '{fid}' depends on unknown '{dep_id}'" for fid, dep_id in missing
+        ]
+        for scc in sccs:
+            if len(scc) > 1 or scc[0] in self._features[scc[0]].dependencies:
+                members = ", ".join(f"'{fid}'" for fid in scc)
+                errors.append(f"Circular dependency detected involving {members}")
+
+        self._validation_cache = errors
+        return list(errors)
+
+    def _strongly_connected(
+        self, missing: list[tuple[str, str]] | None = None
+    ) -> list[list[str]]:
+        """Tarjan's SCC over known dependency edges, with an explicit stack.
+
+        Members of each component are returned in feature insertion order.
+        Edges to unknown features are skipped and, if given, appended to
+        missing as (feature_id, dep_id).
+        """
+        features = self._features
+        index: dict[str, int] = {}
+        lowlink: dict[str, int] = {}
+        on_stack: set[str] = set()
+        stack: list[str] = []
+        sccs: list[list[str]] = []
+
+        for root in features:
+            if root in index:
+                continue
+            index[root] = lowlink[root] = len(index)
+            stack.append(root)
+            on_stack.add(root)
+            work = [(root, iter(features[root].dependencies))]
+            while work:
+                node, deps = work[-1]
+                for dep_id in deps:
+                    if dep_id not in features:
+                        if missing is not None:
+                            missing.append((node, dep_id))
+                        continue
+                    if dep_id not in index:
+                        index[dep_id] = lowlink[dep_id] = len(index)
+                        stack.append(dep_id)
+                        on_stack.add(dep_id)
+                        work.append((dep_id, iter(features[dep_id].dependencies)))
+                        break
+                    if dep_id in on_stack:
+                        lowlink[node] = min(lowlink[node], index[dep_id])
+                else:
+                    # All edges explored: settle node
+                    work.pop()
+                    if work:
+                        parent = work[-1][0]
+                        lowlink[parent] = min(lowlink[parent], lowlink[node])
+                    if lowlink[node] == index[node]:
+                        scc = []
+                        while True:
+                            member = stack.pop()
+                            on_stack.discard(member)
+                            scc.append(member)
+                            if member == node:
+                                break
+                        scc.sort(key=self._order.__getitem__)
+                        sccs.append(scc)
+        return sccs
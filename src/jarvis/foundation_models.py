@@ -12,16 +12,51 @@ If the bridge is not running, all methods return fallback values.
 """
 
 import asyncio
+import concurrent.futures
+import functools
+import hashlib
 import json
 import logging
 import time
+from collections import OrderedDict
 from typing import Any
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
 BRIDGE_URL = "http://127.0.0.1:9848"
 CONNECT_TIMEOUT = 2.0  # seconds
 REQUEST_TIMEOUT = 5.0  # seconds
+RESULT_CACHE_SIZE = 1024  # LRU entries for classify/summarize results
+HEALTH_CHECK_INTERVAL = 60.0  # seconds between checks while available
+HEALTH_CHECK_MAX_INTERVAL = 900.0  # backoff cap while unavailable
+
+
+def _dumps(value: Any) -> bytes:
+    if orjson is not None:
+        try:
+            return orjson.dumps(value)
+        except orjson.JSONEncodeError:
+            pass  # e.g. lone surrogates, which stdlib json escapes as \uXXXX
+    return json.dumps(value).encode()
+
+
+@functools.lru_cache(maxsize=32)
+def _categories_json(categories: tuple[str, ...]) -> bytes:
+    """Serialized category list, reused across classify calls."""
+    return _dumps(list(categories))
+
+
+def _classify_body(text: str, categories: tuple[str, ...]) -> bytes:
+    """Assemble the classify request body around the cached categories."""
+    return (
+        b'{"action":"classify","text":' + _dumps(text)
+        + b',"categories":' + _categories_json(categories) + b"}"
+    )
 
 
 class FoundationModelsClient:
@@ -31,54 +66,117 @@ class FoundationModelsClient:
         self.base_url = base_url
         self._available: bool | None = None
         self._last_health_check: float = 0
-        self._health_check_interval: float = 60.0  # Re-check every 60s
+        # Doubles after each failed check, reset on success
+        self._health_check_interval: float = HEALTH_CHECK_INTERVAL
         self._request_count: int = 0
-        self._total_latency_ms: float = 0
+        self._total_latency_ns: int = 0  # integer; converted in get_stats()
+        # Shared keep-alive client, bound to the loop that created it
+        self._client = None
+        self._client_loop: asyncio.AbstractEventLoop | None = None
+        # Dedicated threads for the urllib fallback, off the default pool
+        self._executor: concurrent.futures.ThreadPoolExecutor | None = None
+        # Bridge results keyed by (action, text digest, params); LRU order
+        self._result_cache: OrderedDict[tuple, Any] = OrderedDict()
+
+    def _cache_get(self, key: tuple) -> Any | None:
+        value = self._result_cache.get(key)
+        if value is not None:
+            self._result_cache.move_to_end(key)
+        return value
+
+    def _cache_put(self, key: tuple, value: Any) -> None:
+        self._result_cache[key] = value
+        self._result_cache.move_to_end(key)
+        if len(self._result_cache) > RESULT_CACHE_SIZE:
+            self._result_cache.popitem(last=False)
+
+    @staticmethod
+    def _digest(text: str) -> bytes:
+        # surrogatepass: text read with surrogateescape must not raise here
+        return hashlib.blake2b(
+            text.encode("utf-8", "surrogatepass"), digest_size=16
+        ).digest()
+
+    def _get_client(self):
+        """Return the pooled httpx client, creating it on first use.
+
+        No lock is needed: creation doesn't await, so concurrent callers on
+        the loop can't interleave here. A client created under a different
+        (e.g. already closed) event loop is replaced rather than reused.
+        """
+        import httpx
 
-    async def _post(self, payload: dict) -> dict | None:
-        """Send a POST request to the Foundation Models bridge."""
+        loop = asyncio.get_running_loop()
+        if self._client is None or self._client_loop is not loop:
+            self._client = httpx.AsyncClient(
+                timeout=REQUEST_TIMEOUT,
+                limits=httpx.Limits(max_keepalive_connections=4),
+            )
+            self._client_loop = loop
+        return self._client
+
+    async def aclose(self) -> None:
+        """Close the pooled HTTP client and fallback executor."""
+        client, self._client, self._client_loop = self._client, None, None
+        if client is not None:
+            await client.aclose()
+        executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False)
+
+    async def _post(self, payload: dict, body: bytes | None = None) -> dict | None:
+        """Send a POST request to the Foundation Models bridge.
+
+        body, when given, is payload already serialized to JSON.
+        """
+        if body is None:
+            body = _dumps(payload)
         try:
-            import httpx
-            async with httpx.AsyncClient(timeout=REQUEST_TIMEOUT) as client:
-                response = await client.post(
-                    self.base_url,
-                    json=payload,
-                    timeout=REQUEST_TIMEOUT,
-                )
-                if response.status_code == 200:
-                    return response.json()
-                logger.debug(f"Bridge returned {response.status_code}")
-                return None
+            client = self._get_client()
+            response = await client.post(
+                self.base_url,
+                content=body,
+                headers={"Content-Type": "application/json"},
+            )
+            if response.status_code == 200:
+                return response.json()
+            logger.debug(f"Bridge returned {response.status_code}")
+            return None
         except ImportError:
             # Fallback to urllib if httpx not available
-            return await self._post_urllib(payload)
+            return await self._post_urllib(payload, body)
         except Exception as e:
             logger.debug(f"Bridge request failed: {e}")
-            self._available = False
+            # Availability is is_available()'s call; just re-probe on next use
+            self._last_health_check = 0
             return None
 
-    async def _post_urllib(self, payload: dict) -> dict | None:
+    async def _post_urllib(self, payload: dict, body: bytes | None = None) -> dict | None:
         """Fallback POST using urllib (no httpx dependency)."""
         import urllib.request
         import urllib.error
 
         try:
-            data = json.dumps(payload).encode()
+            data = body if body is not None else _dumps(payload)
             req = urllib.request.Request(
                 self.base_url,
                 data=data,
                 headers={"Content-Type": "application/json"},
                 method="POST",
             )
-            loop = asyncio.get_event_loop()
+            if self._executor is None:
+                self._executor = concurrent.futures.ThreadPoolExecutor(
+                    max_workers=2, thread_name_prefix="fm-bridge"
+                )
+            loop = asyncio.get_running_loop()
             response = await loop.run_in_executor(
-                None,
+                self._executor,
                 lambda: urllib.request.urlopen(req, timeout=REQUEST_TIMEOUT),
             )
             return json.loads(response.read().decode())
         except Exception as e:
             logger.debug(f"Bridge urllib request failed: {e}")
-            self._available = False
+            self._last_health_check = 0
             return None
 
     async def is_available(self) -> bool:
@@ -93,6 +191,12 @@ class FoundationModelsClient:
         result = await self._post({"action": "health"})
         self._available = result is not None and result.get("status") == "ok"
         self._last_health_check = now
+        if self._available:
+            self._health_check_interval = HEALTH_CHECK_INTERVAL
+        else:
+            self._health_check_interval = min(
+                self._health_check_interval * 2, HEALTH_CHECK_MAX_INTERVAL
+            )
 
         if self._available:
             logger.info("Foundation Models bridge is available")
@@ -117,24 +221,36 @@ class FoundationModelsClient:
         if categories is None:
             categories = ["simple", "moderate", "complex"]
 
-        start = time.monotonic()
-        result = await self._post({
-            "action": "classify",
-            "text": text[:1000],
-            "categories": categories,
-        })
-        elapsed_ms = (time.monotonic() - start) * 1000
+        text = text[:1000]
+        category_key = tuple(categories)
+        cache_key = ("classify", self._digest(text), category_key)
+        cached = self._cache_get(cache_key)
+        if cached is not None:
+            return dict(cached)
+
+        start = time.perf_counter_ns()
+        result = None
+        # Skip the round-trip (and its connect timeout) when the bridge is down
+        if await self.is_available():
+            result = await self._post(
+                {"action": "classify", "text": text, "categories": categories},
+                body=_classify_body(text, category_key),
+            )
+        elapsed_ns = time.perf_counter_ns() - start
+        elapsed_ms = elapsed_ns / 1e6
 
         self._request_count += 1
-        self._total_latency_ms += elapsed_ms
+        self._total_latency_ns += elapsed_ns
 
         if result:
-            return {
+            classification = {
                 "label": result.get("label", categories[0]),
                 "confidence": result.get("confidence", 0.0),
                 "latency_ms": result.get("latencyMs", elapsed_ms),
                 "source": "foundation_models",
             }
+            self._cache_put(cache_key, classification)
+            return dict(classification)
 
         # Fallback
         return {
@@ -177,13 +293,21 @@ class FoundationModelsClient:
         Returns:
             Summarized text
         """
-        result = await self._post({
-            "action": "summarize",
-            "text": text[:2000],
-            "max_length": max_length,
-        })
+        cache_key = ("summarize", self._digest(text[:2000]), max_length)
+        cached = self._cache_get(cache_key)
+        if cached is not None:
+            return cached
+
+        result = None
+        if await self.is_available():
+            result = await self._post({
+                "action": "summarize",
+                "text": text[:2000],
+                "max_length": max_length,
+            })
 
         if result and "summary" in result:
+            self._cache_put(cache_key, result["summary"])
             return result["summary"]
 
         # Fallback: simple truncation
@@ -191,16 +315,13 @@ class FoundationModelsClient:
 
     def get_stats(self) -> dict[str, Any]:
         """Get client statistics."""
-        avg_ms = (
-            self._total_latency_ms / self._request_count
-            if self._request_count > 0
-            else 0
-        )
+        total_ms = self._total_latency_ns / 1e6
+        avg_ms = total_ms / self._request_count if self._request_count > 0 else 0
         return {
             "available": self._available,
             "request_count": self._request_count,
             "avg_latency_ms": round(avg_ms, 1),
-            "total_latency_ms": round(self._total_latency_ms, 1),
+            "total_latency_ms": round(total_ms, 1),
             "base_url": self.base_url,
         }
 
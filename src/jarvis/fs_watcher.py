@@ -9,9 +9,12 @@ debounce to avoid excessive invalidation from rapid saves.
 
 import asyncio
 import hashlib
+import heapq
 import logging
 import os
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Any
 
@@ -39,48 +42,127 @@ try:
 except ImportError:
     HAS_FSEVENTS = False
 
+# Native inotify / ReadDirectoryChangesW / kqueue backends via watchdog
+try:
+    from watchdog.observers import Observer
+    HAS_WATCHDOG = True
+except ImportError:
+    HAS_WATCHDOG = False
+
 logger = logging.getLogger(__name__)
 
 # Default debounce window in seconds to coalesce rapid changes
 DEBOUNCE_SECONDS = 5.0
 
+# Idle polling backs off by doubling the interval up to this cap (seconds)
+MAX_POLL_INTERVAL = 300.0
+IDLE_BACKOFF_STEPS = 4
+
+# Threads used to walk top-level subtrees in parallel during a polling scan
+SCAN_WORKERS = min(8, os.cpu_count() or 1)
+
+# Directory listings are only reused once their mtime is this old (ns)
+DIR_MTIME_SETTLE_NS = 2_000_000_000
+
 # File extensions to monitor
-WATCHED_EXTENSIONS = {
+WATCHED_EXTENSIONS = frozenset({
     ".py", ".js", ".ts", ".jsx", ".tsx", ".rs", ".go", ".java",
     ".swift", ".c", ".cpp", ".h", ".hpp", ".rb", ".php",
     ".json", ".yaml", ".yml", ".toml", ".xml",
     ".html", ".css", ".scss", ".less",
     ".sql", ".sh", ".bash", ".zsh",
-}
+})
 
 # Directories to ignore
-IGNORED_DIRS = {
+IGNORED_DIRS = frozenset({
     ".git", "node_modules", "__pycache__", ".venv", "venv",
     ".tox", ".mypy_cache", ".pytest_cache", ".ruff_cache",
     "dist", "build", ".build", "target", ".next", ".nuxt",
     "coverage", ".coverage", ".eggs", "*.egg-info",
-}
+})
 
 
-def _should_watch(path: Path) -> bool:
-    """Check if a file should be watched."""
-    if path.suffix not in WATCHED_EXTENSIONS:
+def _has_watched_suffix(name: str) -> bool:
+    """Check a bare filename's extension (leading-dot names have none)."""
+    dot = name.rfind(".")
+    return dot > 0 and name[dot:] in WATCHED_EXTENSIONS
+
+
+def _should_watch(path: str | os.PathLike) -> bool:
+    """Check if a file should be watched.
+
+    Works on the path string directly so event handlers do not need to
+    build Path objects per notification.
+    """
+    path = os.fspath(path)
+    if not _has_watched_suffix(os.path.basename(path)):
         return False
-    for part in path.parts:
-        if part in IGNORED_DIRS:
-            return False
-    return True
+    return IGNORED_DIRS.isdisjoint(path.split(os.sep))
 
 
 def _file_hash(path: Path) -> str | None:
-    """Compute a quick content hash for change detection."""
+    """Compute a quick content hash for change detection.
+
+    Streams the file through a 128-bit BLAKE2b in fixed-size chunks rather
+    than reading it into memory whole.
+    """
     try:
-        content = path.read_bytes()
-        return hashlib.md5(content).hexdigest()
+        with open(path, "rb", buffering=0) as f:
+            return hashlib.file_digest(f, lambda: hashlib.blake2b(digest_size=16)).hexdigest()
     except (OSError, PermissionError):
         return None
 
 
+class _Debouncer:
+    """Pending changes that become ready once quiet for ``delay`` seconds.
+
+    Deadlines live in a min-heap of (ready_at, path) so collecting ready
+    paths only touches entries that are due. ``_deadlines`` holds each
+    path's current deadline; heap entries superseded by a later change
+    are dropped when popped. Times are time.monotonic() values.
+
+    Native backends add changes from their event thread while the asyncio
+    loop pops them, so both sides take a short-lived threading.Lock.
+    """
+
+    __slots__ = ("delay", "_heap", "_deadlines", "_lock")
+
+    def __init__(self, delay: float):
+        self.delay = delay
+        self._heap: list[tuple[float, str]] = []
+        self._deadlines: dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._deadlines)
+
+    def __contains__(self, path: str) -> bool:
+        return path in self._deadlines
+
+    def add(self, path: str, now: float | None = None) -> None:
+        """Record a change to path, restarting its quiet period."""
+        if now is None:
+            now = time.monotonic()
+        ready_at = now + self.delay
+        with self._lock:
+            self._deadlines[path] = ready_at
+            heapq.heappush(self._heap, (ready_at, path))
+
+    def pop_ready(self, now: float | None = None) -> list[str]:
+        """Remove and return paths whose quiet period has elapsed."""
+        if now is None:
+            now = time.monotonic()
+        heap = self._heap
+        ready = []
+        with self._lock:
+            while heap and heap[0][0] <= now:
+                ready_at, path = heapq.heappop(heap)
+                if self._deadlines.get(path) == ready_at:
+                    del self._deadlines[path]
+                    ready.append(path)
+        return ready
+
+
 class FileSnapshot:
     """Snapshot of file state for change detection."""
 
@@ -108,22 +190,26 @@ class FSEventsWatcher:
         self.debounce = debounce
         self._running = False
         self._thread = None
-        self._pending_changes: dict[str, float] = {}
+        self._pending_changes = _Debouncer(debounce)
+        # FSEvents reports resolved absolute paths (e.g. /private/var/...)
+        self._project_prefix = os.path.join(os.path.realpath(project_path), "")
         self._change_callbacks: list = []
         self._stream = None
 
     def _fsevents_callback(self, stream, client_info, num_events, event_paths, event_flags, event_ids):
         """FSEvents callback: receives file change events from the OS."""
-        import time
-        now = time.time()
+        now = time.monotonic()
+        prefix = self._project_prefix
+        prefix_len = len(prefix)
         for i in range(num_events):
             path = event_paths[i]
             if isinstance(path, bytes):
                 path = path.decode("utf-8")
-            rel_path = os.path.relpath(path, str(self.project_path))
-            p = Path(rel_path)
-            if _should_watch(Path(path)):
-                self._pending_changes[rel_path] = now
+            if not path.startswith(prefix):
+                continue
+            rel_path = path[prefix_len:]
+            if _should_watch(rel_path):
+                self._pending_changes.add(rel_path, now)
 
     def _run_loop(self):
         """Run the CFRunLoop for FSEvents (runs in a background thread)."""
@@ -150,7 +236,6 @@ class FSEventsWatcher:
         if self._running:
             return
         self._running = True
-        import threading
         self._thread = threading.Thread(target=self._run_loop, daemon=True)
         self._thread.start()
         # Start async processing loop
@@ -161,18 +246,7 @@ class FSEventsWatcher:
         while self._running:
             try:
                 await asyncio.sleep(self.debounce)
-                if not self._pending_changes:
-                    continue
-
-                import time
-                now = time.time()
-                ready = [
-                    p for p, t in self._pending_changes.items()
-                    if now - t >= self.debounce
-                ]
-                for p in ready:
-                    self._pending_changes.pop(p, None)
-
+                ready = self._pending_changes.pop_ready()
                 if ready:
                     for callback in self._change_callbacks:
                         try:
@@ -218,7 +292,8 @@ class FileSystemWatcher:
     """Watches a project directory for file changes and invalidates learnings.
 
     Uses polling rather than OS-specific APIs for portability.
-    The poll interval is configurable (default 30s).
+    The poll interval is configurable (default 30s) and doubles after each
+    idle poll, up to MAX_POLL_INTERVAL, snapping back on the next change.
     """
 
     def __init__(
@@ -232,37 +307,120 @@ class FileSystemWatcher:
         self.memory = memory
         self.poll_interval = poll_interval
         self.debounce = debounce
-        self._snapshots: dict[str, FileSnapshot] = {}
-        self._pending_changes: dict[str, float] = {}  # path -> first_change_time
+        self._snapshots: dict[str, float] = {}  # relative path -> mtime
+        # dir path -> (mtime_ns, watched file paths, subdir paths)
+        self._dir_listings: dict[str, tuple[int, list[str], list[str]]] = {}
+        self._pending_changes = _Debouncer(debounce)  # settles from first change
+        self._idle_polls = 0
         self._running = False
         self._task: asyncio.Task | None = None
         self._change_callbacks: list = []
 
-    def _scan_files(self) -> dict[str, FileSnapshot]:
-        """Scan project directory and build file snapshots."""
-        snapshots: dict[str, FileSnapshot] = {}
+    def _scan_files(self) -> dict[str, float]:
+        """Scan project directory and map relative paths to mtimes.
+
+        Walks the tree with os.scandir, pruning ignored directories and
+        filtering by suffix before any stat() call. A directory whose mtime
+        is unchanged since the last scan has the same entries, so its cached
+        listing is reused instead of re-reading it; the files in it are still
+        stat()ed since editing a file does not touch its directory.
+
+        Top-level subtrees are walked in parallel threads; scandir and stat
+        release the GIL, so this overlaps the syscalls of a cold scan.
+        """
+        root = str(self.project_path)
+        prefix_len = len(os.path.join(root, ""))
+        # Only cache listings whose mtime is safely in the past, so a change
+        # landing in the same timestamp tick as the scan is not missed
+        settled_ns = time.time_ns() - DIR_MTIME_SETTLE_NS
+        snapshots: dict[str, float] = {}
+        listings: dict[str, tuple[int, list[str], list[str]]] = {}
+        subtrees = self._scan_dir(root, prefix_len, settled_ns, snapshots, listings)
+
+        if len(subtrees) > 1 and SCAN_WORKERS > 1:
+            with ThreadPoolExecutor(
+                max_workers=min(SCAN_WORKERS, len(subtrees)),
+                thread_name_prefix="fs-scan",
+            ) as pool:
+                results = list(pool.map(
+                    lambda top: self._scan_subtree(top, prefix_len, settled_ns),
+                    subtrees,
+                ))
+        else:
+            results = [
+                self._scan_subtree(top, prefix_len, settled_ns) for top in subtrees
+            ]
+        for sub_snapshots, sub_listings in results:
+            snapshots.update(sub_snapshots)
+            listings.update(sub_listings)
+
+        self._dir_listings = listings
+        return snapshots
+
+    def _scan_subtree(
+        self, top: str, prefix_len: int, settled_ns: int
+    ) -> tuple[dict[str, float], dict[str, tuple[int, list[str], list[str]]]]:
+        """Walk one subtree, returning its snapshots and directory listings."""
+        snapshots: dict[str, float] = {}
+        listings: dict[str, tuple[int, list[str], list[str]]] = {}
+        stack = [top]
+        while stack:
+            stack.extend(
+                self._scan_dir(stack.pop(), prefix_len, settled_ns, snapshots, listings)
+            )
+        return snapshots, listings
+
+    def _scan_dir(
+        self,
+        dirpath: str,
+        prefix_len: int,
+        settled_ns: int,
+        snapshots: dict[str, float],
+        listings: dict[str, tuple[int, list[str], list[str]]],
+    ) -> list[str]:
+        """Record one directory's watched files and return its subdirectories."""
         try:
-            for root, dirs, files in os.walk(self.project_path):
-                # Skip ignored directories
-                dirs[:] = [d for d in dirs if d not in IGNORED_DIRS]
-                for name in files:
-                    path = Path(root) / name
-                    if not _should_watch(path):
-                        continue
+            dir_mtime = os.stat(dirpath).st_mtime_ns
+        except OSError:
+            return []
+
+        cached = self._dir_listings.get(dirpath)
+        if cached is not None and cached[0] == dir_mtime:
+            listings[dirpath] = cached
+            _, files, subdirs = cached
+            for path in files:
+                try:
+                    snapshots[path[prefix_len:]] = os.stat(path).st_mtime
+                except OSError:
+                    continue
+            return subdirs
+
+        files: list[str] = []
+        subdirs: list[str] = []
+        try:
+            with os.scandir(dirpath) as it:
+                for entry in it:
+                    name = entry.name
                     try:
-                        stat = path.stat()
-                        key = str(path.relative_to(self.project_path))
-                        snapshots[key] = FileSnapshot(
-                            path=path,
-                            mtime=stat.st_mtime,
-                        )
-                    except (OSError, ValueError):
+                        if entry.is_dir(follow_symlinks=False):
+                            if name not in IGNORED_DIRS:
+                                subdirs.append(entry.path)
+                            continue
+                        if not _has_watched_suffix(name):
+                            continue
+                        if not entry.is_file():
+                            continue
+                        files.append(entry.path)
+                        snapshots[entry.path[prefix_len:]] = entry.stat().st_mtime
+                    except OSError:
                         continue
         except OSError:
-            pass
-        return snapshots
+            return []
+        if dir_mtime < settled_ns:
+            listings[dirpath] = (dir_mtime, files, subdirs)
+        return subdirs
 
-    def _detect_changes(self, new_snapshots: dict[str, FileSnapshot]) -> dict[str, str]:
+    def _detect_changes(self, new_snapshots: dict[str, float]) -> dict[str, str]:
         """Compare snapshots and detect changes.
 
         Returns dict of {relative_path: change_type} where change_type
@@ -282,7 +440,7 @@ class FileSystemWatcher:
 
         # Modified files (mtime changed)
         for key in old_keys & new_keys:
-            if new_snapshots[key].mtime != self._snapshots[key].mtime:
+            if new_snapshots[key] != self._snapshots[key]:
                 changes[key] = "modified"
 
         return changes
@@ -292,39 +450,30 @@ class FileSystemWatcher:
 
         Returns number of learnings invalidated.
         """
-        invalidated = 0
-        learnings = self.memory.get_learnings(
-            project_path=str(self.project_path),
-            min_confidence=0.0,
-        )
-
-        for learning in learnings:
-            if learning.get("needs_revalidation"):
-                continue  # Already marked
-
-            # Check if the learning's fix_diff references any changed file
-            fix_diff = learning.get("fix_diff", "")
-            error_msg = learning.get("error_message", "")
-            combined = f"{fix_diff} {error_msg}".lower()
-
-            for changed_file in changed_files:
-                # Check filename match (just the filename, not full path)
-                filename = Path(changed_file).name.lower()
-                if filename in combined:
-                    self.memory.mark_learning_for_revalidation(learning["id"])
-                    invalidated += 1
-                    logger.info(
-                        f"Marked learning {learning['id']} for revalidation "
-                        f"(file changed: {changed_file})"
-                    )
-                    break
+        # Bare filenames only; learnings are indexed by filename, not full path
+        by_name: dict[str, str] = {}
+        for changed_file in changed_files:
+            by_name.setdefault(Path(changed_file).name.lower(), changed_file)
 
-        return invalidated
+        learning_ids = self.memory.mark_learnings_referencing(
+            str(self.project_path), list(by_name)
+        )
+        if learning_ids:
+            logger.info(
+                f"Marked {len(learning_ids)} learnings for revalidation "
+                f"(files changed: {', '.join(sorted(by_name.values()))})"
+            )
+        return len(learning_ids)
+
+    def _current_poll_interval(self) -> float:
+        """Poll interval after backing off for consecutive idle polls."""
+        backoff = self.poll_interval * 2 ** min(self._idle_polls, IDLE_BACKOFF_STEPS)
+        return max(self.poll_interval, min(backoff, MAX_POLL_INTERVAL))
 
     async def _poll_loop(self) -> None:
         """Main polling loop."""
-        # Initial snapshot
-        self._snapshots = self._scan_files()
+        # Initial snapshot (tree walks and DB writes run off the event loop)
+        self._snapshots = await asyncio.to_thread(self._scan_files)
         logger.info(
             f"File watcher started for {self.project_path} "
             f"({len(self._snapshots)} files tracked)"
@@ -332,45 +481,43 @@ class FileSystemWatcher:
 
         while self._running:
             try:
-                await asyncio.sleep(self.poll_interval)
+                await asyncio.sleep(self._current_poll_interval())
 
-                new_snapshots = self._scan_files()
+                new_snapshots = await asyncio.to_thread(self._scan_files)
                 changes = self._detect_changes(new_snapshots)
 
-                if changes:
-                    now = time.time()
-                    for path, change_type in changes.items():
-                        if path not in self._pending_changes:
-                            self._pending_changes[path] = now
-                            logger.debug(f"File {change_type}: {path}")
-
-                    # Process debounced changes
-                    ready_changes = []
-                    still_pending = {}
-                    for path, first_seen in self._pending_changes.items():
-                        if now - first_seen >= self.debounce:
-                            ready_changes.append(path)
-                        else:
-                            still_pending[path] = first_seen
-                    self._pending_changes = still_pending
-
-                    if ready_changes:
-                        invalidated = self._invalidate_learnings(ready_changes)
-                        if invalidated > 0:
-                            logger.info(
-                                f"Invalidated {invalidated} learnings due to "
-                                f"{len(ready_changes)} file changes"
-                            )
-
-                        # Notify callbacks
-                        for callback in self._change_callbacks:
-                            try:
-                                callback(ready_changes)
-                            except Exception as e:
-                                logger.warning(f"File change callback error: {e}")
+                now = time.monotonic()
+                for path, change_type in changes.items():
+                    if path not in self._pending_changes:
+                        self._pending_changes.add(path, now)
+                        logger.debug(f"File {change_type}: {path}")
+
+                # Process debounced changes
+                ready_changes = self._pending_changes.pop_ready(now)
+                if ready_changes:
+                    invalidated = await asyncio.to_thread(
+                        self._invalidate_learnings, ready_changes
+                    )
+                    if invalidated > 0:
+                        logger.info(
+                            f"Invalidated {invalidated} learnings due to "
+                            f"{len(ready_changes)} file changes"
+                        )
+
+                    # Notify callbacks
+                    for callback in self._change_callbacks:
+                        try:
+                            callback(ready_changes)
+                        except Exception as e:
+                            logger.warning(f"File change callback error: {e}")
 
                 # Update snapshots
                 self._snapshots = new_snapshots
+                # Keep the base rate while changes are still settling
+                if changes or self._pending_changes:
+                    self._idle_polls = 0
+                else:
+                    self._idle_polls += 1
 
             except asyncio.CancelledError:
                 break
@@ -410,6 +557,98 @@ class FileSystemWatcher:
             "pending_changes": len(self._pending_changes),
             "running": self._running,
             "poll_interval": self.poll_interval,
+            "current_poll_interval": self._current_poll_interval(),
+        }
+
+
+class WatchdogWatcher(FileSystemWatcher):
+    """Event-driven watcher using watchdog's native OS backends.
+
+    Receives change notifications from inotify (Linux),
+    ReadDirectoryChangesW (Windows) or kqueue instead of rescanning the
+    tree, then debounces and invalidates learnings like the poller.
+    """
+
+    # watchdog also reports opened/closed events; only these change content
+    _CHANGE_EVENTS = frozenset({"created", "modified", "deleted", "moved"})
+
+    def __init__(
+        self,
+        project_path: str,
+        memory: MemoryStore,
+        debounce: float = DEBOUNCE_SECONDS,
+    ):
+        super().__init__(project_path, memory, debounce=debounce)
+        self._observer = None
+
+    def dispatch(self, event) -> None:
+        """watchdog event handler hook (runs on the observer thread)."""
+        if event.is_directory or event.event_type not in self._CHANGE_EVENTS:
+            return
+        now = time.monotonic()
+        root = str(self.project_path)
+        for path in (event.src_path, getattr(event, "dest_path", "")):
+            if not path:
+                continue
+            if isinstance(path, bytes):
+                path = os.fsdecode(path)
+            rel_path = os.path.relpath(path, root)
+            if _should_watch(rel_path):
+                self._pending_changes.add(rel_path, now)
+
+    async def start(self) -> None:
+        """Start the observer thread and the debounce loop."""
+        if self._running:
+            return
+        self._running = True
+        self._observer = Observer()
+        self._observer.schedule(self, str(self.project_path), recursive=True)
+        self._observer.start()
+        self._task = asyncio.create_task(self._process_changes_loop())
+        logger.info(f"Watchdog watcher active for {self.project_path}")
+
+    async def _process_changes_loop(self) -> None:
+        """Invalidate learnings for changes that have settled."""
+        while self._running:
+            try:
+                await asyncio.sleep(self.debounce)
+                ready = self._pending_changes.pop_ready()
+                if ready:
+                    invalidated = await asyncio.to_thread(
+                        self._invalidate_learnings, ready
+                    )
+                    if invalidated > 0:
+                        logger.info(
+                            f"Invalidated {invalidated} learnings due to "
+                            f"{len(ready)} file changes"
+                        )
+                    for callback in self._change_callbacks:
+                        try:
+                            callback(ready)
+                        except Exception as e:
+                            logger.warning(f"File change callback error: {e}")
+
+            except asyncio.CancelledError:
+                break
+            except Exception as e:
+                logger.error(f"Watchdog change processing error: {e}")
+                await asyncio.sleep(5)
+
+    async def stop(self) -> None:
+        """Stop the observer thread and the debounce loop."""
+        await super().stop()
+        if self._observer is not None:
+            observer, self._observer = self._observer, None
+            observer.stop()
+            await asyncio.to_thread(observer.join, 5.0)
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get watcher statistics."""
+        return {
+            "project_path": str(self.project_path),
+            "backend": "watchdog",
+            "pending_changes": len(self._pending_changes),
+            "running": self._running,
         }
 
 
@@ -421,7 +660,8 @@ def create_file_watcher(
 ) -> FileSystemWatcher | FSEventsWatcher:
     """Create the best available file watcher for the platform.
 
-    Uses native FSEvents on macOS if available, falls back to polling.
+    Uses native FSEvents on macOS if available, then watchdog's native
+    backends (inotify, ReadDirectoryChangesW), and falls back to polling.
     """
     if HAS_FSEVENTS:
         logger.info("Using native FSEvents file watcher")
@@ -430,8 +670,15 @@ def create_file_watcher(
             memory=memory,
             debounce=debounce,
         )
+    elif HAS_WATCHDOG:
+        logger.info("Using watchdog file watcher")
+        return WatchdogWatcher(
+            project_path=project_path,
+            memory=memory,
+            debounce=debounce,
+        )
     else:
-        logger.info("Using polling-based file watcher (FSEvents unavailable)")
+        logger.info("Using polling-based file watcher (no native backend available)")
         return FileSystemWatcher(
             project_path=project_path,
             memory=memory,
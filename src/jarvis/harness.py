@@ -307,8 +307,7 @@ class BuildHarness:
 
         if not implemented:
             # Nothing to test - check if more pending features remain
-            pending = [f for f in self._feature_mgr.features if f.status == "pending"]
-            if pending:
+            if any(f.status == "pending" for f in self._feature_mgr.features):
                 self.transition(HarnessState.IMPLEMENT)
             else:
                 self.transition(HarnessState.COMPLETE)
@@ -345,8 +344,7 @@ class BuildHarness:
                 })
 
             # Check for more pending features
-            pending = [f for f in self._feature_mgr.features if f.status == "pending"]
-            if pending:
+            if any(f.status == "pending" for f in self._feature_mgr.features):
                 self.transition(HarnessState.IMPLEMENT)
             else:
                 self.transition(HarnessState.COMPLETE)
@@ -84,6 +84,8 @@ class IdleModeProcessor:
         self._loop_task: asyncio.Task | None = None
         self._state_callbacks: list[Callable] = []
         self._memory_pressure_task: asyncio.Task | None = None
+        # Set on state changes/stop so the loop re-plans its sleep immediately
+        self._wake_event = asyncio.Event()
 
         # Register default background tasks
         self._register_default_tasks()
@@ -206,6 +208,7 @@ class IdleModeProcessor:
 
     def _notify_state_change(self, old: IdleState, new: IdleState) -> None:
         """Notify state change callbacks."""
+        self._wake_event.set()
         for callback in self._state_callbacks:
             try:
                 callback(old.value, new.value)
@@ -230,6 +233,7 @@ class IdleModeProcessor:
 
         revalidated = 0
         decayed = 0
+        updates: list[tuple[int, float]] = []
 
         for learning in learnings:
             if not learning.get("needs_revalidation"):
@@ -246,18 +250,11 @@ class IdleModeProcessor:
             else:
                 revalidated += 1
 
-            # Update in database (clear the revalidation flag,
-            # update confidence)
-            conn = self.memory._get_connection()
-            try:
-                conn.execute(
-                    "UPDATE learnings SET confidence = ?, needs_revalidation = 0 "
-                    "WHERE id = ?",
-                    (new_confidence, learning["id"]),
-                )
-                conn.commit()
-            finally:
-                conn.close()
+            updates.append((learning["id"], new_confidence))
+
+        # Update in database (clear the revalidation flag, update
+        # confidence) in a single transaction
+        self.memory.apply_revalidation(updates)
 
         return {
             "revalidated": revalidated,
@@ -459,10 +456,26 @@ class IdleModeProcessor:
             "avg_tokens_per_call": avg_tokens,
         }
 
+    def _next_wakeup_delay(self) -> float:
+        """Seconds until the loop has something to do (idle threshold or next task).
+
+        Clamped to [1s, 5min]; state changes wake the loop earlier.
+        """
+        now = time.time()
+        if self._state == IdleState.ACTIVE:
+            remaining = self._last_activity + self.idle_threshold - now
+        elif self._state == IdleState.IDLE and self._tasks:
+            remaining = min(t.last_run + t.interval_seconds for t in self._tasks) - now
+        else:
+            remaining = 300.0
+        return max(1.0, min(remaining, 300.0))
+
     async def _process_loop(self) -> None:
         """Main processing loop for idle mode."""
         while self._running:
             try:
+                self._wake_event.clear()
+
                 # Check if we should transition to idle
                 if self._state == IdleState.ACTIVE:
                     elapsed = time.time() - self._last_activity
@@ -486,7 +499,8 @@ class IdleModeProcessor:
                             break  # User became active
 
                         try:
-                            logger.debug(f"Running idle task: {task.name}")
+                            if logger.isEnabledFor(logging.DEBUG):
+                                logger.debug(f"Running idle task: {task.name}")
                             if asyncio.iscoroutinefunction(task.func):
                                 result = await task.func()
                             else:
@@ -494,9 +508,11 @@ class IdleModeProcessor:
                             task.last_run = time.time()
                             task.run_count += 1
                             task.last_error = None
-                            logger.info(
-                                f"Idle task '{task.name}' completed: {result}"
-                            )
+                            # Result dicts can be large; only format them when logged
+                            if logger.isEnabledFor(logging.INFO):
+                                logger.info(
+                                    f"Idle task '{task.name}' completed: {result}"
+                                )
                         except Exception as e:
                             task.last_error = str(e)
                             task.last_run = time.time()
@@ -504,7 +520,13 @@ class IdleModeProcessor:
                                 f"Idle task '{task.name}' failed: {e}"
                             )
 
-                await asyncio.sleep(10)  # Check every 10 seconds
+                # Sleep until the next deadline instead of polling
+                try:
+                    await asyncio.wait_for(
+                        self._wake_event.wait(), timeout=self._next_wakeup_delay()
+                    )
+                except asyncio.TimeoutError:
+                    pass
 
             except asyncio.CancelledError:
                 break
@@ -524,6 +546,7 @@ class IdleModeProcessor:
     async def stop(self) -> None:
         """Stop the idle mode processor."""
         self._running = False
+        self._wake_event.set()
         if self._loop_task:
             self._loop_task.cancel()
             try:
@@ -462,6 +462,41 @@ def get_neural_engine_available() -> bool:
         return IS_APPLE_SILICON
 
 
+# ─── Thread QoS ──────────────────────────────────────────────────────────────
+
+# qos_class_t values from <sys/qos.h>
+QOS_CLASS_USER_INITIATED = 0x19
+QOS_CLASS_UTILITY = 0x11
+
+_libsystem = None
+
+if IS_MACOS:
+    try:
+        _libsystem = ctypes.CDLL("/usr/lib/libSystem.B.dylib")
+        _libsystem.pthread_set_qos_class_self_np.argtypes = [ctypes.c_uint, ctypes.c_int]
+        _libsystem.pthread_set_qos_class_self_np.restype = ctypes.c_int
+    except Exception as e:
+        _libsystem = None
+        logger.debug(f"libSystem load failed: {e}")
+
+
+def set_thread_qos(qos_class: int) -> bool:
+    """Set the calling thread's QoS class via pthread_set_qos_class_self_np.
+
+    USER_INITIATED keeps latency-sensitive threads on performance cores;
+    UTILITY lets the scheduler move background work to efficiency cores.
+    Returns False on non-macOS or on failure.
+    """
+    if _libsystem is None:
+        return False
+
+    try:
+        return _libsystem.pthread_set_qos_class_self_np(qos_class, 0) == 0
+    except Exception as e:
+        logger.debug(f"Thread QoS error: {e}")
+        return False
+
+
 # ─── Platform Summary ────────────────────────────────────────────────────────
 
 def get_platform_capabilities() -> dict[str, Any]:
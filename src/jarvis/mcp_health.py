@@ -197,7 +197,7 @@ async def notify_health_failures(health_results: dict[str, Any]) -> None:
         slack_bot = get_slack_bot()
         if slack_bot:
             message = "MCP Server Health Check Failed:\n" + "\n".join(unhealthy)
-            await slack_bot.post_message(message)
+            await slack_bot.send_message(message)
     except (ImportError, AttributeError) as e:
         logger.debug(f"Slack notification unavailable: {e}")
     except Exception as e:
@@ -7,6 +7,7 @@ Tier 4: Learned patterns (SQLite - developer preferences, decisions)
 """
 
 import json
+import re
 import sqlite3
 import time
 from dataclasses import dataclass
@@ -14,6 +15,18 @@ from pathlib import Path
 
 from jarvis.config import JARVIS_DB, JARVIS_HOME
 
+# Filename-like tokens (name.ext) referenced in a learning's error or diff text
+_FILE_REF_RE = re.compile(r"[\w.-]*\.\w+")
+
+
+def _file_refs(*texts: str | None) -> set[str]:
+    """Extract lowercased filenames referenced in the given texts."""
+    return {
+        ref
+        for text in texts if text
+        for ref in _FILE_REF_RE.findall(text.lower())
+    }
+
 
 @dataclass
 class Task:
@@ -43,6 +56,9 @@ class MemoryStore:
     def _init_db(self) -> None:
         JARVIS_HOME.mkdir(parents=True, exist_ok=True)
         conn = sqlite3.connect(self.db_path)
+        has_file_refs = conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'learning_file_refs'"
+        ).fetchone()
         conn.executescript("""
             CREATE TABLE IF NOT EXISTS tasks (
                 id TEXT PRIMARY KEY,
@@ -134,6 +150,12 @@ class MemoryStore:
                 needs_revalidation INTEGER DEFAULT 0
             );
 
+            CREATE TABLE IF NOT EXISTS learning_file_refs (
+                filename TEXT,
+                learning_id INTEGER,
+                PRIMARY KEY (filename, learning_id)
+            );
+
             CREATE TABLE IF NOT EXISTS skill_candidates (
                 id INTEGER PRIMARY KEY AUTOINCREMENT,
                 pattern_hash TEXT UNIQUE,
@@ -174,6 +196,15 @@ class MemoryStore:
             CREATE INDEX IF NOT EXISTS idx_skill_candidates_hash ON skill_candidates(pattern_hash);
             CREATE INDEX IF NOT EXISTS idx_token_usage_session ON token_usage(session_id);
         """)
+        if not has_file_refs:
+            # Index learnings written before the reverse index existed
+            rows = conn.execute(
+                "SELECT id, error_message, fix_diff FROM learnings"
+            ).fetchall()
+            conn.executemany(
+                "INSERT OR IGNORE INTO learning_file_refs (filename, learning_id) VALUES (?, ?)",
+                [(ref, r[0]) for r in rows for ref in _file_refs(r[1], r[2])],
+            )
         conn.commit()
         conn.close()
 
@@ -421,6 +452,72 @@ class MemoryStore:
         conn.close()
         return event_id
 
+    def record_events(self, events: list[tuple]) -> None:
+        """Record a batch of timeline events in one transaction.
+
+        Args:
+            events: (id, timestamp, event_type, summary, session_id, task_id,
+                feature_id, cost_usd, metadata) tuples; ids are pre-assigned
+                by the caller (see reserve_event_ids)
+        """
+        if not events:
+            return
+        conn = sqlite3.connect(self.db_path)
+        try:
+            conn.executemany(
+                "INSERT INTO timeline_events "
+                "(id, timestamp, event_type, summary, session_id, task_id, feature_id, cost_usd, metadata_json) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                [
+                    (event_id, ts, event_type, summary, session_id, task_id, feature_id,
+                     cost_usd, json.dumps(metadata) if metadata else None)
+                    for event_id, ts, event_type, summary, session_id, task_id, feature_id,
+                    cost_usd, metadata in events
+                ],
+            )
+            conn.commit()
+        finally:
+            # Release the write lock even if the batch is rejected
+            conn.close()
+
+    def reserve_event_ids(self, count: int) -> int:
+        """Atomically reserve a block of timeline event IDs.
+
+        Bumps the AUTOINCREMENT sequence inside an IMMEDIATE transaction, so
+        no other connection or process can be handed an ID in the block.
+
+        Returns:
+            First ID of the reserved block [first, first + count)
+        """
+        conn = sqlite3.connect(self.db_path, isolation_level=None)
+        try:
+            conn.execute("BEGIN IMMEDIATE")
+            row = conn.execute(
+                "SELECT seq FROM sqlite_sequence WHERE name = 'timeline_events'"
+            ).fetchone()
+            max_id = conn.execute(
+                "SELECT COALESCE(MAX(id), 0) FROM timeline_events"
+            ).fetchone()[0]
+            first = max(row[0] if row else 0, max_id) + 1
+            last = first + count - 1
+            if row:
+                conn.execute(
+                    "UPDATE sqlite_sequence SET seq = ? WHERE name = 'timeline_events'",
+                    (last,),
+                )
+            else:
+                conn.execute(
+                    "INSERT INTO sqlite_sequence (name, seq) VALUES ('timeline_events', ?)",
+                    (last,),
+                )
+            conn.execute("COMMIT")
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+        finally:
+            conn.close()
+        return first
+
     def get_timeline(
         self,
         session_id: str | None = None,
@@ -605,6 +702,10 @@ class MemoryStore:
                  fix_description, fix_diff, confidence, now, now),
             )
             learning_id = cursor.lastrowid
+            conn.executemany(
+                "INSERT OR IGNORE INTO learning_file_refs (filename, learning_id) VALUES (?, ?)",
+                [(ref, learning_id) for ref in _file_refs(error_message, fix_diff)],
+            )
 
         conn.commit()
         conn.close()
@@ -652,6 +753,52 @@ class MemoryStore:
         conn.commit()
         conn.close()
 
+    def mark_learnings_referencing(
+        self, project_path: str, filenames: list[str]
+    ) -> list[int]:
+        """Mark learnings that reference any of the given filenames for revalidation.
+
+        Looks the filenames up in the learning_file_refs reverse index, so
+        the cost scales with the number of filenames rather than learnings.
+
+        Args:
+            project_path: Project the learnings belong to
+            filenames: Lowercased bare filenames (no directories)
+
+        Returns:
+            IDs of learnings newly marked (already-marked ones are skipped)
+        """
+        if not filenames:
+            return []
+        placeholders = ", ".join("?" * len(filenames))
+        conn = sqlite3.connect(self.db_path)
+        rows = conn.execute(
+            "UPDATE learnings SET needs_revalidation = 1 "
+            "WHERE project_path = ? AND needs_revalidation = 0 AND id IN ("
+            "SELECT learning_id FROM learning_file_refs "
+            f"WHERE filename IN ({placeholders})) RETURNING id",
+            [project_path, *filenames],
+        ).fetchall()
+        conn.commit()
+        conn.close()
+        return [r[0] for r in rows]
+
+    def apply_revalidation(self, updates: list[tuple[int, float]]) -> None:
+        """Set new confidences and clear the revalidation flag in one transaction.
+
+        Args:
+            updates: (learning_id, new_confidence) pairs
+        """
+        if not updates:
+            return
+        conn = sqlite3.connect(self.db_path)
+        conn.executemany(
+            "UPDATE learnings SET confidence = ?, needs_revalidation = 0 WHERE id = ?",
+            [(confidence, learning_id) for learning_id, confidence in updates],
+        )
+        conn.commit()
+        conn.close()
+
     # --- Skill candidates ---
 
     def record_skill_candidate(
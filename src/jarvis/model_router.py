@@ -384,6 +384,8 @@ class ModelRouter:
             await self._mlx_engine.unload_model()
             self.qwen3_available = False
             logger.info("MLX model unloaded")
+        if self._foundation_client:
+            await self._foundation_client.aclose()
 
     def get_stats(self) -> dict[str, Any]:
         """Get routing statistics."""
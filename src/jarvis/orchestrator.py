@@ -114,6 +114,8 @@ class JarvisOrchestrator:
         self.git_server = create_git_mcp_server()
         self.review_server = create_review_mcp_server()
         self.browser_server = create_browser_mcp_server()
+        # Set by the daemon from its startup health probe; None = not probed
+        self.healthy_mcp_servers: dict | None = None
         self._session_id: str | None = None
         self._active_containers: list[str] = []
         self.loop_detector = LoopDetector(
@@ -512,6 +514,21 @@ Turns: {budget_status['turns']}
 
         return {}
 
+    def mcp_servers(self) -> dict:
+        """All in-process MCP servers owned by the orchestrator."""
+        return {
+            "jarvis-container": self.container_server,
+            "jarvis-git": self.git_server,
+            "jarvis-review": self.review_server,
+            "jarvis-browser": self.browser_server,
+        }
+
+    def _active_mcp_servers(self) -> dict:
+        """MCP servers for agent sessions, minus any quarantined by the health probe."""
+        if self.healthy_mcp_servers is None:
+            return self.mcp_servers()
+        return self.healthy_mcp_servers
+
     def _build_options(self) -> ClaudeAgentOptions:
         """Build Agent SDK options with all Jarvis integrations."""
         options = ClaudeAgentOptions(
@@ -522,12 +539,7 @@ Turns: {budget_status['turns']}
             max_budget_usd=self.config.budget.max_per_session_usd,
             model=self.config.models.executor,
             cwd=self.project_path,
-            mcp_servers={
-                "jarvis-container": self.container_server,
-                "jarvis-git": self.git_server,
-                "jarvis-review": self.review_server,
-                "jarvis-browser": self.browser_server,
-            },
+            mcp_servers=self._active_mcp_servers(),
             hooks={
                 "PreToolUse": [
                     HookMatcher(hooks=[self._pre_tool_hook]),
@@ -35,6 +35,9 @@ logger = logging.getLogger(__name__)
 # Maximum skills that can be active in a single session
 MAX_SKILLS_PER_SESSION = 3
 
+# Bump when bootstrap/skills changes so daemons re-run the install
+BOOTSTRAP_VERSION = 1
+
 SKILL_TEMPLATE = """---
 name: {skill_name}
 description: {description}
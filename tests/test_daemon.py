@@ -0,0 +1,126 @@
+"""Tests for jarvis.daemon — crash logging."""
+
+import asyncio
+
+import pytest
+
+from jarvis.daemon import CrashRecovery, JarvisDaemon, _CrashLogWriter
+
+
+@pytest.fixture
+def crash_log(tmp_path, monkeypatch):
+    path = tmp_path / "logs" / "crash.log"
+    monkeypatch.setattr(CrashRecovery, "CRASH_LOG", path)
+    yield path
+    CrashRecovery.close_crash_log()
+
+
+class TestCrashLog:
+    """Test the background crash log writer."""
+
+    def test_enqueue_then_close_persists(self, crash_log):
+        CrashRecovery.enqueue_crash("first")
+        CrashRecovery.enqueue_crash("second", ValueError("boom"))
+        CrashRecovery.close_crash_log()
+        text = crash_log.read_text()
+        assert "Error: first" in text
+        assert "Error: second" in text
+        assert "ValueError: boom" in text
+        assert text.index("first") < text.index("second")
+
+    def test_sync_log_after_close_keeps_order(self, crash_log):
+        CrashRecovery.enqueue_crash("queued")
+        CrashRecovery.close_crash_log()
+        CrashRecovery.log_crash("sync")
+        text = crash_log.read_text()
+        assert text.index("Error: queued") < text.index("Error: sync")
+
+    def test_unopenable_log_uses_fallback(self, tmp_path):
+        blocker = tmp_path / "not-a-dir"
+        blocker.write_text("")
+        written = []
+        writer = _CrashLogWriter(blocker / "crash.log", written.append)
+        writer.submit(b"record")
+        writer.close()
+        assert written == [b"record"]
+        writer.submit(b"late")
+        assert written == [b"record", b"late"]
+
+    def test_loop_exception_handler_records_crash(self, crash_log):
+        loop = asyncio.new_event_loop()
+        try:
+            JarvisDaemon._on_loop_exception(
+                loop, {"message": "Task exception was never retrieved",
+                       "exception": RuntimeError("lost")},
+            )
+        finally:
+            loop.close()
+        CrashRecovery.close_crash_log()
+        assert "RuntimeError: lost" in crash_log.read_text()
+
+    def test_loop_context_without_exception_not_logged(self, crash_log):
+        loop = asyncio.new_event_loop()
+        try:
+            JarvisDaemon._on_loop_exception(loop, {"message": "Unclosed client session"})
+        finally:
+            loop.close()
+        CrashRecovery.close_crash_log()
+        assert not crash_log.exists()
+
+    def test_record_without_exception_has_no_traceback(self, crash_log):
+        CrashRecovery.log_crash("plain")
+        text = crash_log.read_text()
+        assert "Error: plain" in text
+        assert "Traceback" not in text
+        assert "NoneType: None" not in text
+
+
+class TestRemoteStartup:
+    """Test remote server startup error handling."""
+
+    @pytest.fixture
+    def daemon(self):
+        pytest.importorskip("websockets")
+        from jarvis.daemon import RemoteConfig
+        from jarvis.events import EventCollector
+
+        daemon = JarvisDaemon.__new__(JarvisDaemon)
+        daemon.remote_cfg = RemoteConfig.from_env({"JARVIS_JWT_SECRET": "s"})
+        daemon.events = EventCollector(memory=None)
+        daemon.orchestrator = None
+        return daemon
+
+    async def test_import_error_in_task_group_is_a_warning(
+        self, daemon, monkeypatch, caplog
+    ):
+        async def started():
+            pass
+
+        async def missing_aiohttp(rest_handler):
+            raise ImportError("No module named 'aiohttp'")
+
+        monkeypatch.setattr(daemon, "_start_remote_ws", started)
+        monkeypatch.setattr(daemon, "_start_rest_api", missing_aiohttp)
+        with caplog.at_level("WARNING", logger="jarvis.daemon"):
+            await daemon._start_remote_server()
+        records = [r for r in caplog.records if "aiohttp" in r.getMessage()]
+        assert [r.levelname for r in records] == ["WARNING"]
+        assert "dependencies missing" in records[0].getMessage()
+
+    async def test_tailscale_funnel_killed_on_cancel(self, daemon, monkeypatch):
+        procs = []
+        real_exec = asyncio.create_subprocess_exec
+
+        async def fake_exec(*args, **kwargs):
+            proc = await real_exec("sleep", "30", **kwargs)
+            procs.append(proc)
+            return proc
+
+        monkeypatch.setattr(asyncio, "create_subprocess_exec", fake_exec)
+        task = asyncio.create_task(daemon._start_tailscale_funnel(9848))
+        while not procs:
+            await asyncio.sleep(0.01)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        assert procs[0].returncode is not None
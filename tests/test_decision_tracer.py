@@ -0,0 +1,122 @@
+"""Tests for jarvis.decision_tracer — precedent lookup and trust thresholds."""
+
+import dataclasses
+
+import pytest
+
+from jarvis.decision_tracer import DecisionTracer, TraceCategory, TraceResult
+
+
+def _trace(trace_id, outcome="success", confidence=0.5):
+    return TraceResult(
+        trace_id=trace_id,
+        category="testing",
+        description="desc",
+        decision=f"decision {trace_id}",
+        outcome=outcome,
+        confidence=confidence,
+    )
+
+
+class TestGetRecommendation:
+    """Test trust threshold application."""
+
+    def test_no_traces(self):
+        rec = DecisionTracer.get_recommendation([])
+        assert rec["action"] == "new_decision"
+        assert rec["trace"] is None
+
+    def test_no_successful_traces_returns_first(self):
+        traces = [_trace("a", outcome="failure"), _trace("b", outcome="pending")]
+        rec = DecisionTracer.get_recommendation(traces)
+        assert rec["action"] == "new_decision"
+        assert rec["trace"].trace_id == "a"
+
+    def test_picks_highest_confidence_success(self):
+        traces = [
+            _trace("a", confidence=0.65),
+            _trace("b", outcome="failure", confidence=0.99),
+            _trace("c", confidence=0.8),
+        ]
+        rec = DecisionTracer.get_recommendation(traces)
+        assert rec["action"] == "use"
+        assert rec["trace"].trace_id == "c"
+
+    def test_verify_and_low_confidence(self):
+        assert DecisionTracer.get_recommendation([_trace("a", confidence=0.7)])["action"] == "verify"
+        assert DecisionTracer.get_recommendation([_trace("a", confidence=0.3)])["action"] == "new_decision"
+
+
+class TestTraceResult:
+    """Test the trace record layout."""
+
+    def test_is_frozen_and_hashable(self):
+        t = _trace("a")
+        assert not hasattr(t, "__dict__")
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            t.confidence = 0.9
+        assert len({t, _trace("a")}) == 1
+
+
+class _FakeMCP:
+    def __init__(self, response=None, fail=False):
+        self.response = response
+        self.fail = fail
+        self.calls = []
+
+    async def call_tool(self, name, args):
+        self.calls.append((name, args))
+        if self.fail:
+            raise RuntimeError("mcp down")
+        return self.response
+
+
+class TestQueryPrecedents:
+    """Test MCP lookup with local fallback."""
+
+    async def test_mcp_results_deduplicated(self):
+        item = {"id": "trace-1", "decision": "d", "outcome": "success", "confidence": 0.9}
+        tracer = DecisionTracer(mcp_client=_FakeMCP([item, dict(item), {**item, "id": "trace-2"}]))
+        results = await tracer.query_precedents("q")
+        assert [r.trace_id for r in results] == ["trace-1", "trace-2"]
+
+    async def test_local_fallback(self, memory):
+        tracer = DecisionTracer(memory=memory, mcp_client=_FakeMCP(fail=True))
+        trace_id = await tracer.store_trace(TraceCategory.TESTING, "desc", "decision")
+        results = await tracer.query_precedents("q", category=TraceCategory.TESTING)
+        assert [r.trace_id for r in results] == [trace_id]
+        assert results[0].confidence == 0.5
+
+    async def test_accepts_raw_category_string(self, memory):
+        tracer = DecisionTracer(memory=memory)
+        await tracer.store_trace("testing", "desc", "decision")
+        results = await tracer.query_precedents("q", category=TraceCategory.TESTING)
+        assert results[0].category == "testing"
+
+
+class TestUpdateOutcome:
+    """Test outcome updates across both backends."""
+
+    async def test_updates_mcp_and_local(self, memory):
+        mcp = _FakeMCP(fail=True)
+        tracer = DecisionTracer(memory=memory, mcp_client=mcp)
+        trace_id = await tracer.store_trace(TraceCategory.TESTING, "desc", "decision")
+        await tracer.update_outcome(trace_id, "success", notes="worked")
+        assert mcp.calls[-1] == (
+            "context_update_outcome",
+            {"id": trace_id, "outcome": "success", "notes": "worked"},
+        )
+        results = await DecisionTracer(memory=memory).query_precedents("q")
+        assert results[0].outcome == "success"
+
+
+class TestStoreTrace:
+    """Test trace storage payloads."""
+
+    async def test_context_serialized_compactly(self):
+        mcp = _FakeMCP()
+        tracer = DecisionTracer(mcp_client=mcp)
+        await tracer.store_trace(TraceCategory.TESTING, "d", "x", context={"a": 1, "b": [1, 2]})
+        await tracer.store_trace(TraceCategory.TESTING, "d", "x")
+        assert mcp.calls[0][1]["context"] == '{"a":1,"b":[1,2]}'
+        assert mcp.calls[1][1]["context"] == "{}"
@@ -0,0 +1,171 @@
+"""Tests for jarvis.events — event bus persistence and listeners."""
+
+import asyncio
+import gc
+
+import pytest
+
+from jarvis.events import EVENT_FLUSH_INTERVAL, EventCollector
+from jarvis.memory import MemoryStore
+
+
+class TestEmit:
+    """Test synchronous emit behavior."""
+
+    def test_emit_persists_and_returns_id(self, memory):
+        events = EventCollector(memory, session_id="s-1")
+        eid = events.emit("task_start", "Started", task_id="t-1")
+        assert eid > 0
+        timeline = memory.get_timeline()
+        assert timeline[0]["summary"] == "Started"
+
+    def test_listener_receives_event(self, memory):
+        events = EventCollector(memory, session_id="s-1")
+        received = []
+        events.add_listener(received.append)
+        events.emit("error", "Boom", metadata={"k": "v"})
+        assert received[0]["event_type"] == "error"
+        assert received[0]["session_id"] == "s-1"
+        assert received[0]["metadata"] == {"k": "v"}
+
+    def test_remove_listener(self, memory):
+        events = EventCollector(memory)
+        received = []
+        events.add_listener(received.append)
+        events.remove_listener(received.append)
+        events.emit("error", "Boom")
+        assert received == []
+
+
+    def test_bound_method_listener_is_weak(self, memory):
+        events = EventCollector(memory)
+        received = []
+
+        class Client:
+            def on_event(self, event):
+                received.append(event)
+
+        client = Client()
+        events.add_listener(client.on_event)
+        events.emit("error", "First")
+        del client
+        gc.collect()
+        events.emit("error", "Second")
+        assert [e["summary"] for e in received] == ["First"]
+        assert events._listeners == []
+
+    def test_plain_function_listener_kept(self, memory):
+        events = EventCollector(memory)
+        received = []
+        events.add_listener(lambda event: received.append(event))
+        gc.collect()
+        events.emit("error", "Boom")
+        assert len(received) == 1
+
+    async def test_session_id_is_task_local(self, memory):
+        events = EventCollector(memory, session_id="base")
+
+        async def run(name):
+            events.session_id = name
+            await asyncio.sleep(0)
+            events.emit("task_start", name)
+
+        await asyncio.gather(run("a"), run("b"))
+        for event in memory.get_timeline():
+            assert event["session_id"] == event["summary"]
+        assert events.session_id == "base"
+
+
+class TestBatchedFlush:
+    """Test the background flusher."""
+
+    @pytest.mark.asyncio
+    async def test_flusher_batches_writes(self, memory):
+        events = EventCollector(memory)
+        events.start_flusher()
+        received = []
+        events.add_listener(received.append)
+
+        ids = [events.emit("tool_use", f"Tool {i}") for i in range(5)]
+        assert len(received) == 5  # listeners are still notified inline
+
+        await asyncio.sleep(EVENT_FLUSH_INTERVAL * 4)
+        timeline = memory.get_timeline(limit=10)
+        assert len(timeline) == 5
+        # Rows are stored under the IDs handed out by emit()
+        assert sorted(e["id"] for e in timeline) == sorted(ids)
+        await events.stop_flusher()
+
+    @pytest.mark.asyncio
+    async def test_listeners_get_distinct_ids(self, memory):
+        before = memory.record_event("task_start", "Before")
+        events = EventCollector(memory)
+        events.start_flusher()
+        received = []
+        events.add_listener(received.append)
+        for i in range(3):
+            events.emit("approval_needed", f"Approve {i}")
+        ids = [e["id"] for e in received]
+        assert None not in ids
+        assert len(set(ids)) == 3
+        assert min(ids) > before
+        await events.stop_flusher()
+        # Synchronous writes after stopping don't reuse a batched ID
+        assert events.emit("tool_use", "Sync") > max(ids)
+
+    @pytest.mark.asyncio
+    async def test_two_collectors_share_db(self, memory):
+        daemon = EventCollector(memory)
+        cli = EventCollector(MemoryStore(db_path=memory.db_path))
+        daemon.start_flusher()
+        received = []
+        daemon.add_listener(received.append)
+
+        cli_id = cli.emit("task_start", "CLI first")
+        daemon_ids = [daemon.emit("tool_use", f"Daemon {i}") for i in range(5)]
+        cli_ids = [cli.emit("task_start", f"CLI {i}") for i in range(3)]
+        await daemon.stop_flusher()
+
+        stored = {e["id"]: e["summary"] for e in memory.get_timeline(limit=20)}
+        assert len(stored) == 9
+        for i, eid in enumerate(daemon_ids):
+            assert stored[eid] == f"Daemon {i}"
+        assert [e["id"] for e in received] == daemon_ids
+        assert stored[cli_id] == "CLI first"
+        assert set(cli_ids).isdisjoint(daemon_ids)
+
+    def test_id_conflict_does_not_drop_batch(self, memory):
+        events = EventCollector(memory)
+        taken = memory.record_event("task_start", "Taken")
+        events._write_batch([
+            (taken, 1000.0, "tool_use", "Clash", None, None, None, 0.0, None),
+            (taken + 50, 1001.0, "tool_use", "Fine", None, None, None, 0.0, None),
+        ])
+        summaries = {e["summary"] for e in memory.get_timeline()}
+        assert {"Taken", "Clash", "Fine"} <= summaries
+
+    @pytest.mark.asyncio
+    async def test_enqueue_after_stop_falls_back_to_direct_write(self, memory):
+        events = EventCollector(memory)
+        events.start_flusher()
+        await events.stop_flusher()
+        events._enqueue((42, 1000.0, "tool_use", "Raced", None, None, None, 0.0, None))
+        assert memory.get_timeline()[0]["id"] == 42
+
+    @pytest.mark.asyncio
+    async def test_stop_flusher_drains_cross_thread_rows(self, memory):
+        events = EventCollector(memory)
+        events.start_flusher()
+        await asyncio.to_thread(events.emit, "tool_use", "From thread")
+        await events.stop_flusher()
+        assert memory.get_timeline()[0]["summary"] == "From thread"
+
+    @pytest.mark.asyncio
+    async def test_stop_flusher_persists_pending(self, memory):
+        events = EventCollector(memory)
+        events.start_flusher()
+        events.emit("tool_use", "Pending")
+        await events.stop_flusher()
+        assert memory.get_timeline()[0]["summary"] == "Pending"
+        # Back to synchronous writes
+        assert events.emit("tool_use", "Sync") > 0
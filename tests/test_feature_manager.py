@@ -0,0 +1,212 @@
+"""Tests for jarvis.feature_manager — feature lifecycle and ordering."""
+
+import json
+
+import pytest
+
+import jarvis.feature_manager as feature_manager
+from jarvis.feature_manager import Feature, FeatureManager
+
+
+def _plan(*subtasks):
+    return {"subtasks": list(subtasks)}
+
+
+def _task(fid, priority, deps=()):
+    return {"id": fid, "description": fid, "priority": priority, "dependencies": list(deps)}
+
+
+def _complete(fm, fid):
+    for status in ("in_progress", "implemented", "tested"):
+        fm.mark_status(fid, status)
+
+
+@pytest.fixture
+def fm(tmp_path):
+    return FeatureManager(tmp_path)
+
+
+class TestFeature:
+    """Test the Feature record."""
+
+    def test_slotted(self):
+        feat = Feature(id="a", description="A", priority=1)
+        assert not hasattr(feat, "__dict__")
+        assert Feature.from_dict(feat.to_dict()) == feat
+
+
+class TestGetNextPending:
+    """Test dependency-aware feature ordering."""
+
+    def test_empty(self, fm):
+        assert fm.get_next_pending() is None
+
+    def test_priority_order_with_insertion_tiebreak(self, fm):
+        fm.create_from_plan(_plan(_task("b", 2), _task("z", 1), _task("a", 1)))
+        assert fm.get_next_pending().id == "z"
+
+    def test_waits_for_tested_dependencies(self, fm):
+        fm.create_from_plan(_plan(_task("base", 2), _task("top", 1, ["base"])))
+        assert fm.get_next_pending().id == "base"
+        fm.mark_status("base", "in_progress")
+        fm.mark_status("base", "implemented")
+        assert fm.get_next_pending() is None
+        fm.mark_status("base", "tested")
+        assert fm.get_next_pending().id == "top"
+
+    def test_unknown_dependency_never_ready(self, fm):
+        fm.create_from_plan(_plan(_task("a", 1, ["missing"])))
+        assert fm.get_next_pending() is None
+
+    def test_blocked_feature_returns_when_pending(self, fm):
+        fm.create_from_plan(_plan(_task("a", 1), _task("b", 2)))
+        fm.mark_status("a", "in_progress")
+        fm.mark_status("a", "blocked")
+        assert fm.get_next_pending().id == "b"
+        fm.mark_status("a", "pending")
+        assert fm.get_next_pending().id == "a"
+
+    def test_full_plan_order(self, fm):
+        fm.create_from_plan(_plan(
+            _task("db", 1),
+            _task("api", 2, ["db"]),
+            _task("ui", 1, ["api"]),
+            _task("docs", 3),
+        ))
+        order = []
+        while (feat := fm.get_next_pending()) is not None:
+            order.append(feat.id)
+            _complete(fm, feat.id)
+        assert order == ["db", "api", "ui", "docs"]
+
+    def test_ready_queue_survives_reload(self, fm, tmp_path):
+        fm.create_from_plan(_plan(_task("a", 1), _task("b", 2, ["a"])))
+        _complete(fm, "a")
+        fm.save()
+        reloaded = FeatureManager(tmp_path).load()
+        assert reloaded.get_next_pending().id == "b"
+
+
+class TestValidateFeatures:
+    """Test feature graph validation."""
+
+    def test_valid_graph(self, fm):
+        fm.create_from_plan(_plan(_task("a", 1), _task("b", 2, ["a"])))
+        assert fm.validate_features() == []
+
+    def test_unknown_dependency(self, fm):
+        fm.create_from_plan(_plan(_task("a", 1, ["ghost"])))
+        assert fm.validate_features() == ["Feature 'a' depends on unknown 'ghost'"]
+
+    def test_unknown_dependencies_in_plan_order(self, fm):
+        fm.create_from_plan(_plan(
+            _task("a", 1, ["b", "x"]), _task("b", 2, ["y"]), _task("c", 3, ["z", "w"]),
+        ))
+        assert fm.validate_features() == [
+            "Feature 'a' depends on unknown 'x'",
+            "Feature 'b' depends on unknown 'y'",
+            "Feature 'c' depends on unknown 'z'",
+            "Feature 'c' depends on unknown 'w'",
+        ]
+
+    def test_cycle_reported_once(self, fm):
+        fm.create_from_plan(_plan(
+            _task("a", 1, ["b"]), _task("b", 2, ["c"]), _task("c", 3, ["a"]), _task("d", 4, ["a"]),
+        ))
+        assert fm.validate_features() == [
+            "Circular dependency detected involving 'a', 'b', 'c'"
+        ]
+
+    def test_self_dependency(self, fm):
+        fm.create_from_plan(_plan(_task("a", 1, ["a"])))
+        assert fm.validate_features() == ["Circular dependency detected involving 'a'"]
+
+    def test_deep_chain_has_no_recursion_limit(self, fm):
+        n = 5000
+        fm.create_from_plan(_plan(*(
+            _task(f"f{i}", 1, [f"f{i + 1}"] if i + 1 < n else []) for i in range(n)
+        )))
+        assert fm.validate_features() == []
+
+    def test_cache_invalidated_on_new_features(self, fm):
+        fm.create_from_plan(_plan(_task("a", 1, ["b"])))
+        assert len(fm.validate_features()) == 1
+        fm.validate_features().clear()  # callers can't corrupt the cache
+        assert len(fm.validate_features()) == 1
+        fm.create_from_plan(_plan(_task("b", 2)))
+        assert fm.validate_features() == []
+
+    def test_cache_invalidated_on_load(self, fm, tmp_path):
+        fm.create_from_plan(_plan(_task("a", 1, ["b"])))
+        assert len(fm.validate_features()) == 1
+        other = FeatureManager(tmp_path)
+        other.create_from_plan(_plan(_task("a", 1)))
+        other.save()
+        assert fm.load().validate_features() == []
+
+
+class TestPersistence:
+    """Test saving and loading the feature list."""
+
+    def test_round_trip(self, fm, tmp_path):
+        fm.create_from_plan(_plan(_task("a", 1), _task("b", 2, ["a"])))
+        fm.mark_status("a", "in_progress")
+        fm.save()
+        saved = json.loads((tmp_path / ".jarvis" / "feature-list.json").read_text())
+        assert saved == {"features": [f.to_dict() for f in fm.features]}
+        loaded = FeatureManager(tmp_path).load()
+        assert [f.to_dict() for f in loaded.features] == [f.to_dict() for f in fm.features]
+
+    def test_corrupt_file_loads_empty(self, fm, tmp_path):
+        path = tmp_path / ".jarvis" / "feature-list.json"
+        path.parent.mkdir()
+        path.write_text("{not json")
+        assert len(FeatureManager(tmp_path).load().features) == 0
+
+    def test_stdlib_json_fallback(self, fm, tmp_path, monkeypatch):
+        monkeypatch.setattr(feature_manager, "orjson", None)
+        fm.create_from_plan(_plan(_task("a", 1)))
+        fm.save()
+        assert FeatureManager(tmp_path).load().get_feature("a").priority == 1
+
+    def test_save_leaves_no_temp_file(self, fm, tmp_path):
+        fm.create_from_plan(_plan(_task("a", 1)))
+        fm.save()
+        fm.save()
+        assert sorted(p.name for p in (tmp_path / ".jarvis").iterdir()) == ["feature-list.json"]
+
+    @pytest.mark.parametrize("use_orjson", [True, False])
+    def test_compact_unless_pretty(self, fm, tmp_path, monkeypatch, use_orjson):
+        if not use_orjson:
+            monkeypatch.setattr(feature_manager, "orjson", None)
+        elif feature_manager.orjson is None:
+            pytest.skip("orjson not installed")
+        path = tmp_path / ".jarvis" / "feature-list.json"
+        fm.create_from_plan(_plan(_task("a", 1)))
+        fm.save()
+        assert "\n" not in path.read_text()
+        fm.save(pretty=True)
+        assert '\n  "features"' in path.read_text()
+
+
+class TestProgress:
+    """Test progress counts."""
+
+    def test_counts_by_status(self, fm):
+        fm.create_from_plan(_plan(_task("a", 1), _task("b", 2), _task("c", 3)))
+        _complete(fm, "a")
+        fm.mark_status("b", "in_progress")
+        assert fm.progress() == {
+            "total": 3, "pending": 1, "in_progress": 1,
+            "implemented": 0, "tested": 1, "blocked": 0,
+        }
+
+
+class TestCreateFromPlan:
+    """Test plan ingestion."""
+
+    def test_defaults(self, fm):
+        fm.create_from_plan('{"subtasks": [{"description": "x"}, {"id": "b"}]}')
+        first, second = fm.features
+        assert (first.id, first.priority, first.phase) == ("feat-1", 1, "core")
+        assert (second.id, second.priority, second.description) == ("b", 2, "")
@@ -4,8 +4,11 @@ Works on all platforms. Real integration tests only run when the
 Foundation Models bridge is actually running.
 """
 
+import json
+
 import pytest
 
+import jarvis.foundation_models as foundation_models
 from jarvis.foundation_models import FoundationModelsClient, get_foundation_client
 
 
@@ -64,6 +67,178 @@ class TestFoundationModelsClient:
         result2 = await client.is_available()
         assert result2 is False
 
+    @pytest.mark.asyncio
+    async def test_unavailable_backoff(self, monkeypatch):
+        client = FoundationModelsClient()
+        posts = []
+
+        async def fake_post(payload, body=None):
+            posts.append(payload["action"])
+            return None
+
+        monkeypatch.setattr(client, "_post", fake_post)
+        assert await client.is_available() is False
+        assert client._health_check_interval == 120.0
+        # Known-unavailable: classify falls back without another request
+        result = await client.classify("text")
+        assert result["source"] == "fallback"
+        assert posts == ["health"]
+
+        client._last_health_check = 0
+        await client.is_available()
+        assert client._health_check_interval == 240.0
+
+
+    @pytest.mark.asyncio
+    async def test_http_client_reused_across_requests(self):
+        client = FoundationModelsClient(base_url="http://127.0.0.1:19999")
+        await client.classify("one")
+        http_client = client._client
+        await client.summarize("two")
+        assert client._client is http_client
+        await client.aclose()
+        assert client._client is None
+
+
+    @pytest.mark.asyncio
+    async def test_urllib_fallback_uses_dedicated_executor(self):
+        client = FoundationModelsClient(base_url="http://127.0.0.1:19999")
+        assert await client._post_urllib({"action": "health"}) is None
+        assert client._executor is not None
+        await client.aclose()
+        assert client._executor is None
+
+    @pytest.mark.asyncio
+    async def test_failed_request_does_not_disable_bridge(self, monkeypatch):
+        client = FoundationModelsClient()
+        probes = []
+
+        class Response:
+            status_code = 200
+
+            def __init__(self, data):
+                self._data = data
+
+            def json(self):
+                return self._data
+
+        class FlakyClient:
+            failed = False
+
+            async def post(self, url, content, headers):
+                payload = json.loads(content)
+                if payload["action"] == "health":
+                    probes.append(payload)
+                    return Response({"status": "ok"})
+                if not self.failed:
+                    self.failed = True
+                    raise TimeoutError("read timed out")
+                return Response({"label": "simple", "confidence": 0.8})
+
+        flaky = FlakyClient()
+        monkeypatch.setattr(client, "_get_client", lambda: flaky)
+        first = await client.classify("one")
+        assert first["source"] == "fallback"
+        # The next call re-probes a healthy bridge instead of staying disabled
+        second = await client.classify("two")
+        assert second["source"] == "foundation_models"
+        assert len(probes) == 2
+
+    @pytest.mark.asyncio
+    async def test_lone_surrogate_falls_back(self):
+        client = FoundationModelsClient(base_url="http://127.0.0.1:19999")
+        result = await client.classify("bad \udcff byte")
+        assert result["source"] == "fallback"
+        assert await client.summarize("bad \udcff byte") == "bad \udcff byte"
+
+
+class TestResultCache:
+    """Test caching of bridge results."""
+
+    @pytest.mark.asyncio
+    async def test_classify_cached(self, monkeypatch):
+        client = FoundationModelsClient()
+        calls = []
+
+        async def fake_post(payload, body=None):
+            if payload["action"] == "health":
+                return {"status": "ok"}
+            calls.append(payload)
+            return {"label": "complex", "confidence": 0.9, "latencyMs": 12}
+
+        monkeypatch.setattr(client, "_post", fake_post)
+        first = await client.classify_task_complexity("build a compiler")
+        second = await client.classify_task_complexity("build a compiler")
+        assert first == second
+        assert len(calls) == 1
+        stats = client.get_stats()
+        assert stats["request_count"] == 1
+        assert stats["total_latency_ms"] >= 0
+        await client.classify("build a compiler", categories=["a", "b"])
+        assert len(calls) == 2  # different categories, different key
+
+    @pytest.mark.asyncio
+    async def test_fallback_not_cached(self):
+        client = FoundationModelsClient(base_url="http://127.0.0.1:19999")
+        await client.classify("test text")
+        await client.summarize("test text")
+        assert len(client._result_cache) == 0
+        await client.aclose()
+
+    @pytest.mark.asyncio
+    async def test_cache_bounded(self, monkeypatch):
+        monkeypatch.setattr(foundation_models, "RESULT_CACHE_SIZE", 2)
+        client = FoundationModelsClient()
+
+        async def fake_post(payload, body=None):
+            if payload["action"] == "health":
+                return {"status": "ok"}
+            return {"summary": payload["text"][:3]}
+
+        monkeypatch.setattr(client, "_post", fake_post)
+        for text in ("aaaa", "bbbb", "cccc"):
+            await client.summarize(text)
+        assert len(client._result_cache) == 2
+
+
+class TestRequestBody:
+    """Test request serialization."""
+
+    def test_classify_body_matches_payload(self):
+        body = foundation_models._classify_body('say "hi"\n', ("a", "b"))
+        assert json.loads(body) == {
+            "action": "classify", "text": 'say "hi"\n', "categories": ["a", "b"],
+        }
+
+    @pytest.mark.asyncio
+    async def test_lone_surrogate_body(self, monkeypatch):
+        client = FoundationModelsClient()
+        bodies = []
+
+        class Response:
+            status_code = 200
+
+            def __init__(self, data):
+                self._data = data
+
+            def json(self):
+                return self._data
+
+        class RecordingClient:
+            async def post(self, url, content, headers):
+                payload = json.loads(content)
+                bodies.append(payload)
+                if payload["action"] == "health":
+                    return Response({"status": "ok"})
+                return Response({"label": "simple", "summary": "s"})
+
+        recorder = RecordingClient()
+        monkeypatch.setattr(client, "_get_client", lambda: recorder)
+        text = "bad \udcff byte"
+        assert (await client.classify(text))["source"] == "foundation_models"
+        assert await client.summarize(text) == "s"
+        assert [b["text"] for b in bodies if b["action"] != "health"] == [text, text]
+
 
 class TestSingleton:
     """Test singleton pattern."""
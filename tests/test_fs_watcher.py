@@ -1,11 +1,24 @@
 """Tests for jarvis.fs_watcher — file system monitoring."""
 
+import asyncio
+import os
+import threading
 import time
 from pathlib import Path
 
 import pytest
 
-from jarvis.fs_watcher import FileSnapshot, FileSystemWatcher, _file_hash, _should_watch
+from jarvis.fs_watcher import (
+    HAS_WATCHDOG,
+    FileSnapshot,
+    FileSystemWatcher,
+    FSEventsWatcher,
+    WatchdogWatcher,
+    _Debouncer,
+    _file_hash,
+    _should_watch,
+)
+import jarvis.fs_watcher as fs_watcher
 
 
 class TestShouldWatch:
@@ -36,6 +49,11 @@ class TestShouldWatch:
         assert _should_watch(Path("node_modules/foo/index.js")) is False
         assert _should_watch(Path("__pycache__/mod.py")) is False
 
+    def test_plain_strings(self):
+        assert _should_watch("src/main.py") is True
+        assert _should_watch("node_modules/foo/index.js") is False
+        assert _should_watch(".py") is False
+
 
 class TestFileHash:
     """Test file content hashing."""
@@ -45,7 +63,7 @@ class TestFileHash:
         f.write_text("hello")
         h = _file_hash(f)
         assert h is not None
-        assert len(h) == 32  # MD5 hex digest
+        assert len(h) == 32  # 128-bit hex digest
 
     def test_same_content_same_hash(self, tmp_path):
         f1 = tmp_path / "a.py"
@@ -61,10 +79,57 @@ class TestFileHash:
         f2.write_text("bar")
         assert _file_hash(f1) != _file_hash(f2)
 
+    def test_large_file_streamed(self, tmp_path):
+        f = tmp_path / "big.py"
+        f.write_bytes(b"x" * (1 << 20) + b"tail")
+        h1 = _file_hash(f)
+        f.write_bytes(b"x" * (1 << 20) + b"tall")
+        assert _file_hash(f) != h1
+
     def test_missing_file_returns_none(self, tmp_path):
         assert _file_hash(tmp_path / "nonexistent.py") is None
 
 
+class TestDebouncer:
+    """Test heap-based debouncing of pending changes."""
+
+    def test_ready_after_delay(self):
+        d = _Debouncer(5.0)
+        d.add("a.py", now=100.0)
+        assert d.pop_ready(now=104.9) == []
+        assert d.pop_ready(now=105.0) == ["a.py"]
+        assert len(d) == 0
+
+    def test_later_change_restarts_quiet_period(self):
+        d = _Debouncer(5.0)
+        d.add("a.py", now=100.0)
+        d.add("a.py", now=103.0)
+        assert d.pop_ready(now=106.0) == []
+        assert "a.py" in d
+        assert d.pop_ready(now=108.0) == ["a.py"]
+        assert d.pop_ready(now=200.0) == []
+
+    def test_pops_in_deadline_order(self):
+        d = _Debouncer(1.0)
+        d.add("b.py", now=2.0)
+        d.add("a.py", now=1.0)
+        d.add("c.py", now=9.0)
+        assert d.pop_ready(now=5.0) == ["a.py", "b.py"]
+        assert len(d) == 1
+
+    def test_concurrent_producer(self):
+        d = _Debouncer(0.0)
+        paths = [f"f{i}.py" for i in range(2000)]
+        producer = threading.Thread(target=lambda: [d.add(p) for p in paths])
+        producer.start()
+        ready = []
+        while producer.is_alive():
+            ready.extend(d.pop_ready())
+        producer.join()
+        ready.extend(d.pop_ready())
+        assert sorted(ready) == sorted(paths)
+
+
 class TestFileSystemWatcher:
     """Test file system watcher change detection."""
 
@@ -82,6 +147,28 @@ class TestFileSystemWatcher:
         # project_path has src/main.py, src/utils.py, tests/test_main.py, pyproject.toml
         assert len(snapshots) >= 3
 
+    def test_scan_skips_ignored_dirs_and_suffixes(self, memory, project_path):
+        root = Path(project_path)
+        (root / "node_modules" / "pkg").mkdir(parents=True)
+        (root / "node_modules" / "pkg" / "index.js").write_text("x")
+        (root / "src" / "notes.md").write_text("x")
+        (root / "src" / "deep").mkdir()
+        (root / "src" / "deep" / "mod.py").write_text("x")
+        snapshots = FileSystemWatcher(project_path, memory)._scan_files()
+        assert str(Path("src") / "deep" / "mod.py") in snapshots
+        assert not any("node_modules" in k or k.endswith(".md") for k in snapshots)
+
+    def test_scan_serial_matches_parallel(self, memory, project_path, monkeypatch):
+        for top in ("lib", "docs", "app"):
+            (Path(project_path) / top / "pkg").mkdir(parents=True)
+            (Path(project_path) / top / "pkg" / "mod.py").write_text("x")
+        parallel = FileSystemWatcher(project_path, memory)._scan_files()
+        monkeypatch.setattr(fs_watcher, "SCAN_WORKERS", 1)
+        serial = FileSystemWatcher(project_path, memory)._scan_files()
+        assert parallel == serial
+        assert str(Path("app") / "pkg" / "mod.py") in serial
+        assert "pyproject.toml" in serial
+
     def test_detect_created_file(self, memory, project_path):
         watcher = self._make_watcher(memory, project_path)
         watcher._snapshots = watcher._scan_files()
@@ -117,6 +204,47 @@ class TestFileSystemWatcher:
         deleted = [k for k, v in changes.items() if v == "deleted"]
         assert any("utils.py" in f for f in deleted)
 
+    def _age_dirs(self, project_path):
+        old = time.time() - 60
+        for d in [Path(project_path), *Path(project_path).rglob("*")]:
+            if d.is_dir():
+                os.utime(d, (old, old))
+
+    def test_unchanged_dir_listing_reused(self, memory, project_path):
+        watcher = self._make_watcher(memory, project_path)
+        self._age_dirs(project_path)
+        watcher._snapshots = watcher._scan_files()
+        src = str(Path(project_path) / "src")
+        assert src in watcher._dir_listings
+
+        # Editing a file leaves the directory mtime alone
+        main_py = Path(project_path) / "src" / "main.py"
+        os.utime(main_py, (time.time() + 10, time.time() + 10))
+        changes = watcher._detect_changes(watcher._scan_files())
+        assert changes == {str(Path("src") / "main.py"): "modified"}
+
+    def test_changed_dir_reread(self, memory, project_path):
+        watcher = self._make_watcher(memory, project_path)
+        self._age_dirs(project_path)
+        watcher._snapshots = watcher._scan_files()
+
+        (Path(project_path) / "src" / "added.py").write_text("x")
+        changes = watcher._detect_changes(watcher._scan_files())
+        assert changes == {str(Path("src") / "added.py"): "created"}
+
+    def test_idle_poll_backoff(self, memory):
+        watcher = FileSystemWatcher("/tmp", memory, poll_interval=30.0)
+        assert watcher._current_poll_interval() == 30.0
+        watcher._idle_polls = 2
+        assert watcher._current_poll_interval() == 120.0
+        watcher._idle_polls = 10
+        assert watcher._current_poll_interval() == fs_watcher.MAX_POLL_INTERVAL
+
+    def test_backoff_never_below_base(self, memory):
+        watcher = FileSystemWatcher("/tmp", memory, poll_interval=600.0)
+        watcher._idle_polls = 3
+        assert watcher._current_poll_interval() == 600.0
+
     def test_invalidate_learnings(self, memory, project_path):
         # Create a learning that references main.py
         memory.save_learning(
@@ -158,3 +286,27 @@ class TestFileSystemWatcher:
         assert watcher._running is True
         await watcher.stop()
         assert watcher._running is False
+
+
+@pytest.mark.skipif(not HAS_WATCHDOG, reason="watchdog not installed")
+class TestWatchdogWatcher:
+    """Test the event-driven watchdog backend."""
+
+    @pytest.mark.asyncio
+    async def test_reports_changed_file(self, memory, project_path):
+        watcher = WatchdogWatcher(project_path, memory, debounce=0.1)
+        received = []
+        watcher.add_change_callback(received.extend)
+        await watcher.start()
+        try:
+            (Path(project_path) / "src" / "main.py").write_text("changed")
+            (Path(project_path) / "notes.md").write_text("ignored")
+            for _ in range(50):
+                if received:
+                    break
+                await asyncio.sleep(0.1)
+        finally:
+            await watcher.stop()
+        assert str(Path("src") / "main.py") in received
+        assert "notes.md" not in received
+        assert watcher.get_stats()["backend"] == "watchdog"
@@ -100,6 +100,27 @@ class TestIdleModeProcessor:
         await processor.stop()
         assert processor._running is False
 
+    def test_wakeup_delay_until_idle_threshold(self, memory):
+        processor = IdleModeProcessor(memory, "/proj", idle_threshold_minutes=1.0)
+        processor._last_activity = time.time() - 20
+        assert processor._next_wakeup_delay() == pytest.approx(40, abs=1)
+
+    def test_wakeup_delay_until_next_task(self, memory):
+        processor = IdleModeProcessor(memory, "/proj")
+        processor.trigger_idle()
+        now = time.time()
+        for task in processor._tasks:
+            task.last_run = now
+        processor._tasks[0].last_run = now - processor._tasks[0].interval_seconds + 30
+        assert processor._next_wakeup_delay() == pytest.approx(30, abs=1)
+
+    @pytest.mark.asyncio
+    async def test_state_change_wakes_loop(self, memory):
+        processor = IdleModeProcessor(memory, "/proj")
+        processor._wake_event.clear()
+        processor.trigger_idle()
+        assert processor._wake_event.is_set()
+
     @pytest.mark.asyncio
     async def test_revalidate_learnings(self, memory):
         # Add a learning that needs revalidation
@@ -11,6 +11,7 @@ import pytest
 from jarvis.macos_native import (
     IS_APPLE_SILICON,
     IS_MACOS,
+    QOS_CLASS_UTILITY,
     get_apple_silicon_info,
     get_idle_seconds,
     get_memory_pressure,
@@ -20,6 +21,7 @@ from jarvis.macos_native import (
     keychain_delete,
     keychain_retrieve,
     keychain_store,
+    set_thread_qos,
     spotlight_index_project,
     spotlight_search,
     spotlight_search_code,
@@ -73,6 +75,10 @@ class TestPlatformGuards:
     def test_neural_engine_false_on_linux(self):
         assert get_neural_engine_available() is False
 
+    @pytest.mark.skipif(IS_MACOS, reason="Testing non-macOS behavior")
+    def test_thread_qos_fails_on_linux(self):
+        assert set_thread_qos(QOS_CLASS_UTILITY) is False
+
 
 class TestPlatformCapabilities:
     """Test platform capability summary."""
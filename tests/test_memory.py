@@ -1,6 +1,7 @@
 """Tests for jarvis.memory — MemoryStore persistence layer."""
 
 import json
+import sqlite3
 import time
 
 import pytest
@@ -200,6 +201,45 @@ class TestLearnings:
         learnings = memory.get_learnings(project_path="/proj", min_confidence=0.0)
         assert learnings[0]["needs_revalidation"] == 1
 
+    def test_apply_revalidation(self, memory):
+        a = memory.save_learning("/proj", "python", "h1", "E", "F", "d")
+        b = memory.save_learning("/proj", "python", "h2", "E", "F", "d")
+        memory.mark_learning_for_revalidation(a)
+        memory.mark_learning_for_revalidation(b)
+        memory.apply_revalidation([(a, 0.56), (b, 0.2)])
+        learnings = {l["id"]: l for l in memory.get_learnings("/proj", min_confidence=0.0)}
+        assert learnings[a]["confidence"] == 0.56
+        assert learnings[b]["confidence"] == 0.2
+        assert not learnings[a]["needs_revalidation"]
+        assert not learnings[b]["needs_revalidation"]
+
+    def test_mark_learnings_referencing(self, memory):
+        a = memory.save_learning("/proj", "python", "h1", "Error in src/Main.py", "F", "d")
+        b = memory.save_learning("/proj", "python", "h2", "E", "F", "--- a/utils.py")
+        c = memory.save_learning("/proj", "python", "h3", "E", "F", "--- a/myutils.py")
+        other = memory.save_learning("/other", "python", "h4", "main.py", "F", "d")
+        marked = memory.mark_learnings_referencing("/proj", ["main.py", "utils.py"])
+        assert sorted(marked) == sorted([a, b])
+        # Already-marked learnings are not reported again
+        assert memory.mark_learnings_referencing("/proj", ["main.py"]) == []
+        learnings = {l["id"]: l for l in memory.get_learnings(min_confidence=0.0)}
+        assert not learnings[c]["needs_revalidation"]
+        assert not learnings[other]["needs_revalidation"]
+
+    def test_mark_learnings_referencing_empty(self, memory):
+        assert memory.mark_learnings_referencing("/proj", []) == []
+
+    def test_file_refs_backfilled_for_existing_db(self, tmp_path):
+        db = tmp_path / "old.db"
+        store = MemoryStore(db_path=db)
+        lid = store.save_learning("/proj", "python", "h1", "Error in app.py", "F", "d")
+        conn = sqlite3.connect(db)
+        conn.execute("DROP TABLE learning_file_refs")
+        conn.commit()
+        conn.close()
+        store = MemoryStore(db_path=db)
+        assert store.mark_learnings_referencing("/proj", ["app.py"]) == [lid]
+
 
 class TestSkillCandidates:
     """Test skill candidate tracking."""
@@ -262,6 +302,24 @@ class TestTimelineEvents:
         assert len(events) == 1
         assert events[0]["summary"] == "Started feature X"
 
+    def test_record_events_batch(self, memory):
+        memory.record_events([
+            (7, 1000.0, "task_start", "Start", "s-1", "t-1", None, None, None),
+            (8, 1001.0, "cost_update", "Cost", "s-1", None, None, 0.5, {"model": "x"}),
+        ])
+        events = memory.get_timeline()
+        assert len(events) == 2
+        assert events[0]["cost_usd"] == 0.5
+        assert [e["id"] for e in events] == [8, 7]
+        assert memory.reserve_event_ids(10) == 9
+        memory.record_events([])  # no-op
+
+    def test_reserve_event_ids_blocks_autoincrement(self, memory):
+        first = memory.reserve_event_ids(5)
+        assert memory.reserve_event_ids(5) == first + 5
+        # Other writers get IDs above every reserved block
+        assert memory.record_event("task_start", "Other") == first + 10
+
     def test_filter_by_event_type(self, memory):
         memory.record_event("task_start", "Start")
         memory.record_event("task_complete", "Done")